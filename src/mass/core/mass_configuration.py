@@ -14,6 +14,7 @@ Involved in model construction:
 
 Involved in model simulation:
     * :meth:`~MassBaseConfiguration.decimal_precision`
+    * :meth:`~MassBaseConfiguration.round_function`
     * :meth:`~MassBaseConfiguration.steady_state_threshold`
 
 Involved in flux balance analysis (FBA):
@@ -39,14 +40,118 @@ Notes
   :class:`~.Configuration` class from :mod:`cobra`.
 
 """
+from functools import partial
+from numbers import Integral
+from string import Formatter
+from types import MappingProxyType
+
 from cobra.core.configuration import Configuration
 from cobra.core.singleton import Singleton
 from cobra.util.solver import interface_to_str
-from six import integer_types, iteritems, itervalues, string_types
 
 
 COBRA_CONFIGURATION = Configuration()
 
+_NUMERIC_TYPES = (int, float)
+"""tuple: Types accepted for numerical configuration values."""
+
+_SHARED_STATE_KEYS = {
+    k: k.lstrip("_") for k in COBRA_CONFIGURATION.__dict__ if k.startswith("_")
+}
+"""dict: Public names of the private shared configuration attributes."""
+
+_MODEL_CREATOR_KEYS_ORDERED = ("familyName", "givenName", "organization", "email")
+"""tuple: Keys for the model creator in their default order."""
+
+_MODEL_CREATOR_KEYS = frozenset(_MODEL_CREATOR_KEYS_ORDERED)
+"""frozenset: Valid keys for the model creator."""
+
+_DEFAULT_BOUNDARY_COMPARTMENT = MappingProxyType({"b": "boundary"})
+"""MappingProxyType: Default boundary compartment."""
+
+_DEFAULT_COMPARTMENT = MappingProxyType({"compartment": "default_compartment"})
+"""MappingProxyType: Default compartment."""
+
+_DEFAULT_EXCLUDE_METABOLITES_FROM_RATES = MappingProxyType(
+    {"elements": (MappingProxyType({"H": 2, "O": 1}), MappingProxyType({"H": 1}))}
+)
+"""MappingProxyType: Default metabolites excluded from rates (water, protons)."""
+
+_REPR_HTML_TEMPLATE = """
+        <table>
+            <tr><tr>
+                <td><strong>Boundary Compartment</strong></td>
+                <td>{boundary_compartment}</td>
+            </tr><tr>
+                <td><strong>Default Compartment</strong></td>
+                <td>{default_compartment}</td>
+            </tr><tr>
+                <td><strong>Irreversible Reaction Keq</strong></td>
+                <td>{irreversible_Keq}</td>
+            </tr><tr>
+                <td><strong>Irreversible Reaction kr</strong></td>
+                <td>{irreversible_kr}</td>
+            </tr><tr>
+                <td><strong>Metabolites excluded in rates</strong></td>
+                <td>{excluded_metabolites_in_rates}</td>
+            </tr><tr>
+                <td><strong>Compartments in rates</strong></td>
+                <td>{exclude_comp_vols}</td>
+            </tr><tr>
+                <td><strong>Model creator set</strong></td>
+                <td>{model_creator}</td>
+            </tr><tr>
+                <td><strong>Decimal precision</strong></td>
+                <td>{decimal_precision}</td>
+            </tr><tr>
+                <td><strong>Steady state threshold</strong></td>
+                <td>{steady_state_threshold}</td>
+            </tr>
+                <td><strong>Solver</strong></td>
+                <td>{solver}</td>
+            </tr><tr>
+                <td><strong>Solver tolerance</strong></td>
+                <td>{tolerance}</td>
+            </tr><tr>
+                <td><strong>Lower bound</strong></td>
+                <td>{lower_bound}</td>
+            </tr><tr>
+                <td><strong>Upper bound</strong></td>
+                <td>{upper_bound}</td>
+            </tr><tr>
+                <td><strong>Processes</strong></td>
+                <td>{processes}</td>
+            </tr>
+        </table>"""
+"""str: Template for the HTML representation of the configuration."""
+
+_REPR_TEMPLATE = """MassConfiguration:
+        boundary compartment: {boundary_compartment}
+        default compartment: {default_compartment}
+        irreversible reaction Keq: {irreversible_Keq}
+        irreversible reaction kr: {irreversible_kr}
+        metabolites excluded in rates: {excluded_metabolites_in_rates}
+        include compartments in rates: {exclude_comp_vols}
+        model creator set: {model_creator}
+        decimal_precision: {decimal_precision}
+        steady_state_threshold: {steady_state_threshold}
+        solver: {solver}
+        solver tolerance: {tolerance}
+        lower_bound: {lower_bound}
+        upper_bound: {upper_bound}
+        processes: {processes}"""
+"""str: Template for the string representation of the configuration."""
+
+_PARSED_REPR_HTML_TEMPLATE = tuple(
+    (literal, field) for literal, field, _, _ in Formatter().parse(_REPR_HTML_TEMPLATE)
+)
+"""tuple: Literal text and field name pairs of the HTML representation."""
+
+_PARSED_REPR_TEMPLATE = tuple(
+    (literal, field) for literal, field, _, _ in Formatter().parse(_REPR_TEMPLATE)
+)
+"""tuple: Literal text and field name pairs of the string representation."""
+
 
 class MassBaseConfiguration:
     """Define global configuration values honored by :mod:`mass` functions.
@@ -59,31 +164,40 @@ class MassBaseConfiguration:
 
     """
 
+    __slots__ = (
+        "_boundary_compartment",
+        "_default_compartment",
+        "_irreversible_Keq",
+        "_irreversible_kr",
+        "_exclude_metabolites_from_rates",
+        "_exclude_compartment_volumes_in_rates",
+        "_model_creator",
+        "_model_creator_view",
+        "_decimal_precision",
+        "_round_function",
+        "_steady_state_threshold",
+    )
+
     def __init__(self):
         """Initialize MassBaseConfiguration."""
         # Model construction configuration options
-        self._boundary_compartment = {"b": "boundary"}
-        self._default_compartment = {"compartment": "default_compartment"}
+        self._boundary_compartment = dict(_DEFAULT_BOUNDARY_COMPARTMENT)
+        self._default_compartment = dict(_DEFAULT_COMPARTMENT)
         self._irreversible_Keq = float("inf")
         self._irreversible_kr = None
         self._exclude_metabolites_from_rates = {
-            "elements": [{"H": 2, "O": 1}, {"H": 1}]
+            attr: [dict(value) for value in values]
+            for attr, values in _DEFAULT_EXCLUDE_METABOLITES_FROM_RATES.items()
         }
         self._exclude_compartment_volumes_in_rates = True
-        self._model_creator = {
-            "familyName": "",
-            "givenName": "",
-            "organization": "",
-            "email": "",
-        }
+        self._model_creator = dict.fromkeys(_MODEL_CREATOR_KEYS_ORDERED, "")
+        self._model_creator_view = MappingProxyType(self._model_creator)
 
         # Model simulation options
         self._decimal_precision = None
+        self._round_function = _no_rounding
         self._steady_state_threshold = 1e-6
 
-        # For cobra configuration synchronization
-        self._shared_state = COBRA_CONFIGURATION.__dict__
-
     @property
     def boundary_compartment(self):
         """Get or set the default value for the boundary compartment.
@@ -95,12 +209,12 @@ class MassBaseConfiguration:
             mapped to the name of the boundary compartment.
 
         """
-        return getattr(self, "_boundary_compartment")
+        return self._boundary_compartment
 
     @boundary_compartment.setter
     def boundary_compartment(self, compartment_dict):
         """Set the default value for the boundary compartment."""
-        setattr(self, "_boundary_compartment", compartment_dict)
+        self._boundary_compartment = compartment_dict
 
     @property
     def default_compartment(self):
@@ -113,12 +227,12 @@ class MassBaseConfiguration:
             mapped to the name of the default compartment.
 
         """
-        return getattr(self, "_default_compartment")
+        return self._default_compartment
 
     @default_compartment.setter
     def default_compartment(self, compartment_dict):
         """Set the default value for the default compartment."""
-        setattr(self, "_default_compartment", compartment_dict)
+        self._default_compartment = compartment_dict
 
     @property
     def irreversible_Keq(self):
@@ -140,17 +254,14 @@ class MassBaseConfiguration:
             Occurs when trying to set a negative value.
 
         """
-        return getattr(self, "_irreversible_Keq")
+        return self._irreversible_Keq
 
     @irreversible_Keq.setter
     def irreversible_Keq(self, value):
         """Set the default value for Keq of an irreversible reaction."""
         if value is not None:
-            if not isinstance(value, (integer_types, float)):
-                raise TypeError("Must be an int or float")
-            if value < 0.0:
-                raise ValueError("Must be a non-negative number")
-        setattr(self, "_irreversible_Keq", value)
+            value = _validate_non_negative(value)
+        self._irreversible_Keq = value
 
     @property
     def irreversible_kr(self):
@@ -172,17 +283,14 @@ class MassBaseConfiguration:
             Occurs when trying to set a negative value.
 
         """
-        return getattr(self, "_irreversible_kr")
+        return self._irreversible_kr
 
     @irreversible_kr.setter
     def irreversible_kr(self, value):
         """Set the default value for kr of an irreversible reaction."""
         if value is not None:
-            if not isinstance(value, (integer_types, float)):
-                raise TypeError("Must be an int or float")
-            if value < 0.0:
-                raise ValueError("Must be a non-negative number")
-        setattr(self, "_irreversible_kr", value)
+            value = _validate_non_negative(value)
+        self._irreversible_kr = value
 
     @property
     def model_creator(self):
@@ -190,7 +298,7 @@ class MassBaseConfiguration:
 
         Notes
         -----
-        * A read-only copy of the ``dict`` is returned.
+        * A read-only view of the ``dict`` is returned.
         * To successfully export a model creator, all keys must have non-empty
           string values.
 
@@ -209,23 +317,25 @@ class MassBaseConfiguration:
             Values must be strings or ``None``.
 
         """
-        return self._model_creator.copy()
+        return self._model_creator_view
 
     @model_creator.setter
     def model_creator(self, creator_dict):
         """Set the information in the dict representing the model creator."""
-        valid = {"familyName", "givenName", "organization", "email"}
-        for k, v in iteritems(creator_dict):
-            if k not in valid:
-                raise ValueError(
-                    "Invalid key '{0}'. Keys can only be the"
-                    " following: {1:r}".format(k, str(valid))
-                )
-            if v is not None and not isinstance(v, string_types):
-                raise TypeError(
-                    "'{0}' not a string. Values must be strings or"
-                    " None.".format(str(v))
+        invalid = creator_dict.keys() - _MODEL_CREATOR_KEYS
+        if invalid:
+            raise ValueError(
+                "Invalid keys {0!r}. Keys can only be the following: {1!r}".format(
+                    sorted(invalid), sorted(_MODEL_CREATOR_KEYS)
                 )
+            )
+        invalid = [
+            v for v in creator_dict.values() if v is not None and not isinstance(v, str)
+        ]
+        if invalid:
+            raise TypeError(
+                "{0!r} not strings. Values must be strings or None.".format(invalid)
+            )
 
         self._model_creator.update(creator_dict)
 
@@ -248,14 +358,14 @@ class MassBaseConfiguration:
             Does not apply to boundary reactions.
 
         """
-        return getattr(self, "_exclude_metabolites_from_rates")
+        return self._exclude_metabolites_from_rates
 
     @exclude_metabolites_from_rates.setter
     def exclude_metabolites_from_rates(self, to_exclude):
         """Set the metabolites that should be excluded from rates."""
         if not isinstance(to_exclude, dict):
             raise TypeError("Must be a ``dict``.")
-        setattr(self, "_exclude_metabolites_from_rates", to_exclude)
+        self._exclude_metabolites_from_rates = to_exclude
 
     @property
     def exclude_compartment_volumes_in_rates(self):
@@ -269,14 +379,14 @@ class MassBaseConfiguration:
             Whether to exclude the compartment volumes in rate expressions.
 
         """
-        return getattr(self, "_exclude_compartment_volumes_in_rates")
+        return self._exclude_compartment_volumes_in_rates
 
     @exclude_compartment_volumes_in_rates.setter
     def exclude_compartment_volumes_in_rates(self, value):
         """Set whether to exclude the compartment volumes in rates."""
         if not isinstance(value, bool):
             raise TypeError("Must be a ``bool``.")
-        setattr(self, "_exclude_compartment_volumes_in_rates", value)
+        self._exclude_compartment_volumes_in_rates = value
 
     @property
     def decimal_precision(self):
@@ -299,15 +409,31 @@ class MassBaseConfiguration:
             rounding occur. If ``None``, no rounding will occur.
 
         """
-        return getattr(self, "_decimal_precision")
+        return self._decimal_precision
 
     @decimal_precision.setter
     def decimal_precision(self, precision):
         """Set the default decimal precision when rounding."""
-        if precision is not None and not isinstance(precision, integer_types):
+        if precision is None:
+            self._round_function = _no_rounding
+        elif isinstance(precision, Integral):
+            precision = int(precision)
+            self._round_function = partial(round, ndigits=precision)
+        else:
             raise TypeError("precision must be an int.")
 
-        setattr(self, "_decimal_precision", precision)
+        self._decimal_precision = precision
+
+    @property
+    def round_function(self):
+        """Return a function that rounds a value to the decimal precision.
+
+        The function returns values unchanged if the
+        :attr:`decimal_precision` is ``None``. Binding it once avoids checking
+        the :attr:`decimal_precision` for every value that is rounded.
+
+        """
+        return self._round_function
 
     @property
     def steady_state_threshold(self):
@@ -337,16 +463,12 @@ class MassBaseConfiguration:
             Occurs when trying to set a negative value.
 
         """
-        return getattr(self, "_steady_state_threshold")
+        return self._steady_state_threshold
 
     @steady_state_threshold.setter
     def steady_state_threshold(self, threshold):
         """Set the default decimal precision when rounding."""
-        if not isinstance(threshold, (integer_types, float)):
-            raise TypeError("Must be an int or float")
-        if threshold < 0.0:
-            raise ValueError("Must be a non-negative number")
-        setattr(self, "_steady_state_threshold", threshold)
+        self._steady_state_threshold = _validate_non_negative(threshold)
 
     @property
     def solver(self):
@@ -465,7 +587,35 @@ class MassBaseConfiguration:
     @property
     def shared_state(self):
         """Return a read-only ``dict`` for shared configuration attributes."""
-        return {k.lstrip("_"): v for k, v in iteritems(getattr(self, "_shared_state"))}
+        return {
+            _SHARED_STATE_KEYS.get(k, k): v
+            for k, v in vars(COBRA_CONFIGURATION).items()
+        }
+
+    def _get_repr_values(self):
+        """Return the values to format into the configuration representations.
+
+        Warnings
+        --------
+        This method is intended for internal use only.
+
+        """
+        return {
+            "boundary_compartment": _format_compartment(self._boundary_compartment),
+            "default_compartment": _format_compartment(self._default_compartment),
+            "irreversible_Keq": self._irreversible_Keq,
+            "irreversible_kr": self._irreversible_kr,
+            "excluded_metabolites_in_rates": bool(self._exclude_metabolites_from_rates),
+            "exclude_comp_vols": self._exclude_compartment_volumes_in_rates,
+            "model_creator": any(self._model_creator.values()),
+            "decimal_precision": self._decimal_precision,
+            "steady_state_threshold": self._steady_state_threshold,
+            "solver": interface_to_str(COBRA_CONFIGURATION.solver),
+            "tolerance": COBRA_CONFIGURATION.tolerance,
+            "lower_bound": COBRA_CONFIGURATION.lower_bound,
+            "upper_bound": COBRA_CONFIGURATION.upper_bound,
+            "processes": COBRA_CONFIGURATION.processes,
+        }
 
     def _repr_html_(self):
         """Return the HTML representation of the MassConfiguration.
@@ -475,73 +625,7 @@ class MassBaseConfiguration:
         This method is intended for internal use only.
 
         """
-        return """
-        <table>
-            <tr><tr>
-                <td><strong>Boundary Compartment</strong></td>
-                <td>{boundary_compartment}</td>
-            </tr><tr>
-                <td><strong>Default Compartment</strong></td>
-                <td>{default_compartment}</td>
-            </tr><tr>
-                <td><strong>Irreversible Reaction Keq</strong></td>
-                <td>{irreversible_Keq}</td>
-            </tr><tr>
-                <td><strong>Irreversible Reaction kr</strong></td>
-                <td>{irreversible_kr}</td>
-            </tr><tr>
-                <td><strong>Metabolites excluded in rates</strong></td>
-                <td>{excluded_metabolites_in_rates}</td>
-            </tr><tr>
-                <td><strong>Compartments in rates</strong></td>
-                <td>{exclude_comp_vols}</td>
-            </tr><tr>
-                <td><strong>Model creator set</strong></td>
-                <td>{model_creator}</td>
-            </tr><tr>
-                <td><strong>Decimal precision</strong></td>
-                <td>{decimal_precision}</td>
-            </tr><tr>
-                <td><strong>Steady state threshold</strong></td>
-                <td>{steady_state_threshold}</td>
-            </tr>
-                <td><strong>Solver</strong></td>
-                <td>{solver}</td>
-            </tr><tr>
-                <td><strong>Solver tolerance</strong></td>
-                <td>{tolerance}</td>
-            </tr><tr>
-                <td><strong>Lower bound</strong></td>
-                <td>{lower_bound}</td>
-            </tr><tr>
-                <td><strong>Upper bound</strong></td>
-                <td>{upper_bound}</td>
-            </tr><tr>
-                <td><strong>Processes</strong></td>
-                <td>{processes}</td>
-            </tr>
-        </table>""".format(
-            boundary_compartment=[
-                "{0} ({1})".format(v, k) if v else k
-                for k, v in iteritems(self.boundary_compartment)
-            ][0],
-            default_compartment=[
-                "{0} ({1})".format(v, k) if v else k
-                for k, v in iteritems(self.default_compartment)
-            ][0],
-            irreversible_Keq=self.irreversible_Keq,
-            irreversible_kr=self.irreversible_kr,
-            excluded_metabolites_in_rates=bool(self.exclude_metabolites_from_rates),
-            exclude_comp_vols=self.exclude_compartment_volumes_in_rates,
-            model_creator=bool(any(itervalues(self.model_creator))),
-            decimal_precision=self.decimal_precision,
-            steady_state_threshold=self.steady_state_threshold,
-            solver=interface_to_str(self.solver),
-            tolerance=self.tolerance,
-            lower_bound=self.lower_bound,
-            upper_bound=self.upper_bound,
-            processes=self.processes,
-        )
+        return _render_template(_PARSED_REPR_HTML_TEMPLATE, self._get_repr_values())
 
     def __repr__(self):
         """Override default :func:`repr` for the MassConfiguration.
@@ -551,47 +635,66 @@ class MassBaseConfiguration:
         This method is intended for internal use only.
 
         """
-        return """MassConfiguration:
-        boundary compartment: {boundary_compartment}
-        default compartment: {default_compartment}
-        irreversible reaction Keq: {irreversible_Keq}
-        irreversible reaction kr: {irreversible_kr}
-        metabolites excluded in rates: {excluded_metabolites_in_rates}
-        include compartments in rates: {exclude_comp_vols}
-        model creator set: {model_creator}
-        decimal_precision: {decimal_precision}
-        steady_state_threshold: {steady_state_threshold}
-        solver: {solver}
-        solver tolerance: {tolerance}
-        lower_bound: {lower_bound}
-        upper_bound: {upper_bound}
-        processes: {processes}""".format(
-            boundary_compartment=[
-                "{0} ({1})".format(v, k) if v else k
-                for k, v in iteritems(self.boundary_compartment)
-            ][0],
-            default_compartment=[
-                "{0} ({1})".format(v, k) if v else k
-                for k, v in iteritems(self.default_compartment)
-            ][0],
-            irreversible_Keq=self.irreversible_Keq,
-            irreversible_kr=self.irreversible_kr,
-            excluded_metabolites_in_rates=bool(self.exclude_metabolites_from_rates),
-            exclude_comp_vols=self.exclude_compartment_volumes_in_rates,
-            model_creator=bool(any(itervalues(self.model_creator))),
-            decimal_precision=self.decimal_precision,
-            steady_state_threshold=self.steady_state_threshold,
-            solver=interface_to_str(self.solver),
-            tolerance=self.tolerance,
-            lower_bound=self.lower_bound,
-            upper_bound=self.upper_bound,
-            processes=self.processes,
-        )
+        return _render_template(_PARSED_REPR_TEMPLATE, self._get_repr_values())
+
+
+def _no_rounding(value):
+    """Return the value unchanged when no decimal precision is set.
+
+    Warnings
+    --------
+    This method is intended for internal use only.
+
+    """
+    return value
+
+
+def _validate_non_negative(value):
+    """Validate that the value is a non-negative number and return it.
+
+    Warnings
+    --------
+    This method is intended for internal use only.
+
+    """
+    if not isinstance(value, _NUMERIC_TYPES):
+        raise TypeError("Must be an int or float")
+    if value < 0.0:
+        raise ValueError("Must be a non-negative number")
+    return value
+
+
+def _render_template(parsed_template, values):
+    """Render a parsed representation template with the given values.
+
+    Warnings
+    --------
+    This method is intended for internal use only.
+
+    """
+    return "".join(
+        literal if field is None else literal + str(values[field])
+        for literal, field in parsed_template
+    )
+
+
+def _format_compartment(compartment_dict):
+    """Format the first compartment in the ``dict`` for representations.
+
+    Warnings
+    --------
+    This method is intended for internal use only.
+
+    """
+    k, v = next(iter(compartment_dict.items()))
+    return "{0} ({1})".format(v, k) if v else k
 
 
 class MassConfiguration(MassBaseConfiguration, metaclass=Singleton):
     """Define the configuration to be :class:`.Singleton` based."""
 
+    __slots__ = ()
+
 
 __all__ = (
     "MassConfiguration",
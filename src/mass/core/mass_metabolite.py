@@ -21,7 +21,6 @@ listed below:
       brackets (e.g. ``"[ENZYME]"``)
 
 """
-import re
 from warnings import warn
 
 from cobra.core.metabolite import Metabolite, element_re, elements_and_molecular_weights
@@ -296,7 +295,10 @@ class MassMetabolite(Metabolite):
         """
         met_id_str = str(self)
         if self.compartment:
-            met_id_str = re.sub("_" + self.compartment + "$", "", met_id_str)
+            # Compare the suffix literally instead of compiling a pattern
+            suffix = "_" + self.compartment
+            if met_id_str.endswith(suffix):
+                met_id_str = met_id_str[: -len(suffix)]
 
         return met_id_str
 
@@ -336,12 +338,14 @@ class MassMetabolite(Metabolite):
             id=self.id,
             name=format_long_string(self.name),
             formula=self.formula,
-            address="0x0%x" % id(self),
+            address=hex(id(self)),
             compartment=self.compartment,
             fixed="Fixed at " if self.fixed else "",
             ic=self.initial_condition,
             n_reactions=len(self.reactions),
-            reactions=format_long_string(", ".join(r.id for r in self.reactions), 200),
+            reactions=format_long_string(
+                ", ".join([r.id for r in self.reactions]), 200
+            ),
         )
 
     def __dir__(self):
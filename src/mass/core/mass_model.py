@@ -31,10 +31,11 @@ listed below:
       beimg added to the :class:`MassModel`.
 
 """
-import re
 import warnings
 from copy import copy, deepcopy
 from functools import partial
+from itertools import chain
+from weakref import WeakKeyDictionary
 
 import numpy as np
 import sympy as sym
@@ -45,21 +46,23 @@ from cobra.core.metabolite import Metabolite
 from cobra.core.model import Model
 from cobra.core.reaction import Reaction
 from cobra.exceptions import SolverNotFound
-from cobra.util.array import create_stoichiometric_matrix
 from cobra.util.context import get_context
 from cobra.util.util import format_long_string
+from scipy.sparse import csr_matrix
 from six import integer_types, iteritems, iterkeys, itervalues, string_types
 
 from mass.core.mass_configuration import MassConfiguration
 from mass.core.mass_metabolite import MassMetabolite
 from mass.core.mass_reaction import MassReaction
 from mass.core.units import UnitDefinition
-from mass.util.expressions import create_custom_rate, strip_time
+from mass.util.expressions import create_custom_rate, generate_odes, strip_time
 from mass.util.matrix import _get_matrix_constructor, convert_matrix, matrix_rank
 from mass.util.util import (
+    _bulk_undo,
     _check_kwargs,
     _make_logger,
     ensure_iterable,
+    ensure_non_negative_value,
     get_public_attributes_and_methods,
 )
 
@@ -73,6 +76,53 @@ CHOPNSQ = ["C", "H", "O", "P", "N", "S", "q"]
 
 MASSCONFIGURATION = MassConfiguration()
 
+_S_CACHE = WeakKeyDictionary()
+"""WeakKeyDictionary: Stoichiometric matrix per model with the key it was built for."""
+
+_RANK_CACHE = WeakKeyDictionary()
+"""WeakKeyDictionary: Rank per model with the cached matrix it was computed for."""
+
+_HTML_TEMPLATE = """
+            <table>
+                <tr>
+                    <td><strong>Name</strong></td><td>{name}</td>
+                </tr><tr>
+                    <td><strong>Memory address</strong></td><td>{address}</td>
+                </tr><tr>
+                    <td><strong>Stoichiometric Matrix</strong></td>
+                    <td>{dim_stoich_mat}</td>
+                </tr><tr>
+                    <td><strong>Matrix Rank</strong></td>
+                    <td>{mat_rank}</td>
+                </tr><tr>
+                    <td><strong>Number of metabolites</strong></td>
+                    <td>{num_metabolites}</td>
+                </tr><tr>
+                    <td><strong>Initial conditions defined</strong></td>
+                    <td>{num_ic}/{num_metabolites}</td>
+                </tr><tr>
+                    <td><strong>Number of reactions</strong></td>
+                    <td>{num_reactions}</td>
+                </tr><tr>
+                    <td><strong>Number of genes</strong></td>
+                    <td>{num_genes}</td>
+                </tr><tr>
+                    <td><strong>Number of enzyme modules</strong></td>
+                    <td>{num_enzyme_modules}</td>
+                </tr><tr>
+                    <td><strong>Number of groups</strong></td>
+                    <td>{num_groups}</td>
+                </tr><tr>
+                    <td><strong>Objective expression</strong></td>
+                    <td>{objective}</td>
+                </tr><tr>
+                    <td><strong>Compartments</strong></td>
+                    <td>{compartments}</td>
+                </tr>
+            </table>
+        """
+"""str: Template for the HTML representation of a :class:`MassModel`."""
+
 
 class MassModel(Model):
     r"""Class representation of a model.
@@ -89,7 +139,8 @@ class MassModel(Model):
     array_type : str
         A string identifiying the desired format for the returned matrix.
         Valid matrix types include ``'dense'``, ``'dok'``, ``'lil'``,
-        ``'DataFrame'``, and ``'symbolic'`` Default is ``'DataFrame'``.
+        ``'csr'``, ``'DataFrame'``, and ``'symbolic'``
+        Default is ``'DataFrame'``.
         See the :mod:`~.matrix` module documentation for more information
         on the ``array_type``.
     dtype : data-type
@@ -195,7 +246,7 @@ class MassModel(Model):
     @property
     def ordinary_differential_equations(self):
         """Return a ``dict`` of ODEs for the metabolites."""
-        return {met: met.ode for met in self.metabolites}
+        return generate_odes(self)
 
     @property
     def odes(self):
@@ -259,9 +310,10 @@ class MassModel(Model):
         :attr:`.MassReaction.boundary_metabolite`
 
         """
-        return sorted(
-            list(set(rxn.boundary_metabolite for rxn in self.reactions if rxn.boundary))
-        )
+        # Non-boundary reactions return None for their boundary metabolite
+        boundary_metabolites = {rxn.boundary_metabolite for rxn in self.reactions}
+        boundary_metabolites.discard(None)
+        return sorted(boundary_metabolites)
 
     @property
     def exchanges(self):
@@ -299,16 +351,17 @@ class MassModel(Model):
     @property
     def parameters(self):
         """Return all parameters associateed with the model."""
-        parameters = {}
-        # Sort rate and equilibrium constants into seperate dictionaries,
-        # then add dictionaries to returned parameter dictionary.
-        for p_type in ["kf", "Keq", "kr"]:
-            p_type_dict = {}
-            for rxn in self.reactions:
-                p_sym = getattr(rxn, p_type + "_str")
-                if p_sym in rxn.parameters:
-                    p_type_dict.update({p_sym: rxn.parameters[p_sym]})
-            parameters.update({p_type: p_type_dict})
+        p_types = ("kf", "Keq", "kr")
+        parameters = {p_type: {} for p_type in p_types}
+        # Sort rate and equilibrium constants into seperate dictionaries in a
+        # single pass over the reactions.
+        for rxn in self.reactions:
+            rxn_parameters = rxn.parameters
+            if not rxn_parameters:
+                continue
+            for p_type, p_sym in zip(p_types, (rxn.kf_str, rxn.Keq_str, rxn.kr_str)):
+                if p_sym in rxn_parameters:
+                    parameters[p_type][p_sym] = rxn_parameters[p_sym]
         # Add fluxes, custom parameters, and fixed concentrations.
         parameters.update(
             {
@@ -369,13 +422,15 @@ class MassModel(Model):
         array_type : str
             A string identifiying the desired format for the returned matrix.
             Valid matrix types include ``'dense'``, ``'dok'``, ``'lil'``,
-            ``'DataFrame'``, and ``'symbolic'``
+            ``'csr'``, ``'DataFrame'``, and ``'symbolic'``
             Default is the current ``array_type``. See the :mod:`~.matrix`
             module documentation for more information on the ``array_type``.
         dtype : data-type
             The desired array data-type for the stoichiometric matrix.
             If ``None`` then the data-type will default to the
-            current ``dtype``.
+            current ``dtype``. Compact integer data-types (e.g. ``np.int8``)
+            reduce memory use, but every stoichiometric coefficient must be
+            exactly representable in them.
         update_model : bool
             If ``True``, will update the stored stoichiometric matrix,
             the matrix type, and the data-type for the model.
@@ -387,29 +442,47 @@ class MassModel(Model):
             as the given ``array_type`` and with a data-type of ``dtype``.
 
         """
-        # Use the model's stored matrix type if the matrix-type is not given.
+        # Check input of update_model
+        if not isinstance(update_model, bool):
+            raise TypeError("update_model must be a bool.")
+
+        # Use current array type and dtype if None provided
         if array_type is None:
             array_type = self._array_type
-        # Use the model's stored data-type if the data-type is not specified.
         if dtype is None:
             dtype = self._dtype
 
-        # Check input of update_model
-        if not isinstance(update_model, bool):
-            raise TypeError("update_model must be a bool.")
-
-        # If a matrix has not been constructed yet, or if there are no changes
-        # to the reactions, return a newly constructed stoichiometric matrix.
-        stoich_mat = self._mk_stoich_matrix(
-            array_type=array_type, dtype=dtype, update_model=update_model
+        # Reuse the previously built matrix if no stoichiometry changed. The
+        # key only holds identifiers since the objects refer back to the model.
+        cache_key = (
+            array_type,
+            dtype,
+            tuple(met.id for met in self.metabolites),
+            tuple(
+                (rxn.id, tuple((met.id, c) for met, c in rxn._metabolites.items()))
+                for rxn in self.reactions
+            ),
         )
-        # Internally update the model if desired
+        cached = _S_CACHE.get(self)
+        if cached is None or cached[0] != cache_key:
+            # Construct the matrix from the current reaction stoichiometry
+            cached = (
+                cache_key,
+                self._mk_stoich_matrix(
+                    array_type=array_type, dtype=dtype, update_model=False
+                ),
+            )
+            _S_CACHE[self] = cached
+        stoich_mat = cached[1]
+
+        # Store the matrix with its type and data-type if updating the model.
         if update_model:
             self._S = stoich_mat
             self._array_type = array_type
             self._dtype = dtype
 
-        return stoich_mat
+        # Return a copy so the cached matrix cannot be modified in place
+        return stoich_mat.copy()
 
     def add_metabolites(self, metabolite_list):
         r"""Add a ``list`` of metabolites to the model.
@@ -469,9 +542,10 @@ class MassModel(Model):
             raise TypeError("boundary_conditions must be a dict.")
 
         boundary_conditions_to_set = boundary_conditions.copy()
+        boundary_metabolites = set(self.boundary_metabolites)
         for bound_met, bound_cond in iteritems(boundary_conditions_to_set):
             if (
-                bound_met not in self.boundary_metabolites
+                bound_met not in boundary_metabolites
                 and bound_met not in self.metabolites
             ):
                 raise ValueError(
@@ -505,12 +579,13 @@ class MassModel(Model):
         self.boundary_conditions.update(boundary_conditions_to_set)
 
         if context:
-            context(
-                partial(self.boundary_conditions.pop, key)
-                for key in iterkeys(boundary_conditions)
+            undo_ops = [
+                (self.boundary_conditions.pop, key)
+                for key in boundary_conditions_to_set
                 if key not in existing_concs
-            )
-            context(partial(self.boundary_conditions.update, existing_concs))
+            ]
+            undo_ops.append((self.boundary_conditions.update, existing_concs))
+            context(partial(_bulk_undo, undo_ops))
 
     def remove_boundary_conditions(self, boundary_metabolite_list):
         """Remove the boundary condition for a list of `boundary metabolites`.
@@ -579,23 +654,27 @@ class MassModel(Model):
             A ``list`` of :class:`~.MassReaction`\ s to add to the model.
 
         """
-        reaction_list = ensure_iterable(reaction_list)
-        for i, reaction in enumerate(reaction_list):
-            if isinstance(reaction, MassReaction):
-                # No need to change MassReaction objects
+        # Validate, filter and convert the reactions in a single pass
+        existing_id = self.reactions.has_id
+        to_add = []
+        for reaction in ensure_iterable(reaction_list):
+            if not isinstance(reaction, Reaction):
+                # Input not recognized.
+                raise TypeError("Unrecognized input {0}".format(str(reaction)))
+            if existing_id(reaction.id):
+                LOGGER.warning(
+                    "Ignoring reaction '%s' since it already exists.", reaction.id
+                )
                 continue
-            elif isinstance(reaction, Reaction):
+            if not isinstance(reaction, MassReaction):
                 # Convert reaction to a MassReaction and raise a warning
                 warnings.warn(
                     "'{0}' is not a mass.MassReaction, therefore "
                     "converting reaction before adding.".format(reaction.id)
                 )
-                mass_reaction = MassReaction(reaction)
-                reaction_list[i] = mass_reaction
-            else:
-                # Input not recognized.
-                raise TypeError("Unrecognized input {0}".format(str(reaction)))
-        super(MassModel, self).add_reactions(reaction_list)
+                reaction = MassReaction(reaction)
+            to_add.append(reaction)
+        super(MassModel, self).add_reactions(to_add)
 
     def remove_reactions(self, reactions, remove_orphans=False):
         r"""Remove reactions from the model.
@@ -806,11 +885,12 @@ class MassModel(Model):
         if rate_type not in {0, 1, 2, 3}:
             raise ValueError("rate_type must be 0, 1, 2, or 3")
 
-        # Use the MassModel reactions if no reaction list is given
+        # Use the MassModel reactions if no reaction list is given,
+        # otherwise ensure list is iterable.
         if reaction_list is None:
             reaction_list = self.reactions
-        # Ensure list is iterable.
-        reaction_list = ensure_iterable(reaction_list)
+        else:
+            reaction_list = ensure_iterable(reaction_list)
 
         if rate_type == 0:
             rate_dict = {rxn: rxn.rate for rxn in reaction_list}
@@ -843,18 +923,17 @@ class MassModel(Model):
             reaction ids and values are the ratios.
 
         """
-        # Use the MassModel reactions if no reaction list is given
+        # Use the MassModel reactions if no reaction list is given,
+        # otherwise ensure list is iterable.
         if reaction_list is None:
             reaction_list = self.reactions
-        # Ensure list is iterable.
-        reaction_list = ensure_iterable(reaction_list)
-
-        ratio_dict = dict(
-            (rxn, rxn.get_mass_action_ratio())
-            if sympy_expr
-            else (rxn, str(rxn.get_disequilibrium_ratio()))
-            for rxn in reaction_list
-        )
+        else:
+            reaction_list = ensure_iterable(reaction_list)
+
+        ratio_dict = {rxn: rxn.get_mass_action_ratio() for rxn in reaction_list}
+        # Only convert to strings when requested
+        if not sympy_expr:
+            ratio_dict = {rxn: str(ratio) for rxn, ratio in ratio_dict.items()}
         return ratio_dict
 
     def get_disequilibrium_ratios(self, reaction_list=None, sympy_expr=True):
@@ -877,18 +956,17 @@ class MassModel(Model):
             reaction ids and values are the ratios.
 
         """
-        # Use the MassModel reactions if no reaction list is given
+        # Use the MassModel reactions if no reaction list is given,
+        # otherwise ensure list is iterable.
         if reaction_list is None:
             reaction_list = self.reactions
-        # Ensure list is iterable.
-        reaction_list = ensure_iterable(reaction_list)
-
-        ratio_dict = dict(
-            (rxn, rxn.get_disequilibrium_ratio())
-            if sympy_expr
-            else (rxn, str(rxn.get_disequilibrium_ratio()))
-            for rxn in reaction_list
-        )
+        else:
+            reaction_list = ensure_iterable(reaction_list)
+
+        ratio_dict = {rxn: rxn.get_disequilibrium_ratio() for rxn in reaction_list}
+        # Only convert to strings when requested
+        if not sympy_expr:
+            ratio_dict = {rxn: str(ratio) for rxn, ratio in ratio_dict.items()}
         return ratio_dict
 
     def add_custom_rate(self, reaction, custom_rate, custom_parameters=None):
@@ -938,30 +1016,38 @@ class MassModel(Model):
             custom_rate = str(custom_rate)
 
         # Use any existing custom parameters if they are in the rate law.
-        existing_customs = self.custom_parameters
-        if existing_customs:
-            for custom_parameter in iterkeys(existing_customs):
-                if (
-                    re.search(custom_parameter, custom_rate)
-                    and custom_parameter not in custom_parameter_list
-                ):
-                    custom_parameter_list.append(custom_parameter)
+        # Parameter identifiers are matched literally rather than as patterns.
+        listed = set(custom_parameter_list)
+        custom_parameter_list.extend(
+            [
+                custom_parameter
+                for custom_parameter in iterkeys(self.custom_parameters)
+                if custom_parameter not in listed and custom_parameter in custom_rate
+            ]
+        )
         # Create the custom rate expression
         custom_rate = create_custom_rate(reaction, custom_rate, custom_parameter_list)
-        self.custom_rates.update({reaction: custom_rate})
-        self.custom_parameters.update(custom_parameters)
 
         context = get_context(self)
         if context:
-            context(partial(self.custom_rates.pop, reaction))
-            context(
-                partial(
-                    (self.custom_parameters.pop, key)
-                    for key in custom_parameter_list
-                    if key in iterkeys(self.custom_parameters)
-                )
-            )
-            context(partial(self.custom_parameters.update, existing_customs))
+            # Restore any replaced rate or parameter values, otherwise remove
+            if reaction in self.custom_rates:
+                undo_ops = [
+                    (self.custom_rates.update, {reaction: self.custom_rates[reaction]})
+                ]
+            else:
+                undo_ops = [(self.custom_rates.pop, reaction)]
+            replaced = {}
+            for key in custom_parameters:
+                if key in self.custom_parameters:
+                    replaced[key] = self.custom_parameters[key]
+                else:
+                    undo_ops.append((self.custom_parameters.pop, key))
+            undo_ops.append((self.custom_parameters.update, replaced))
+            context(partial(_bulk_undo, undo_ops))
+
+        self.custom_rates.update({reaction: custom_rate})
+        self.custom_parameters.update(custom_parameters)
 
     def remove_custom_rate(self, reaction, remove_orphans=True):
         """Remove the custom rate for a given reaction from the model.
@@ -990,29 +1076,24 @@ class MassModel(Model):
         del self.custom_rates[reaction]
 
         # Remove orphaned custom parameters if desired.
-        args = rate_to_remove.atoms(sym.Symbol)
-        standards = [sym.Symbol(arg) for arg in reaction.all_parameter_ids + ["t"]]
+        standards = set(reaction.all_parameter_ids + ["t"])
+        args = {str(arg) for arg in rate_to_remove.free_symbols} - standards
         # Save currently existing parameters for context management if needed.
         existing = {
-            str(arg): self.custom_parameters[str(arg)]
+            arg: self.custom_parameters[arg]
             for arg in args
-            if arg in self.custom_parameters and arg not in standards
+            if arg in self.custom_parameters
         }
 
         if remove_orphans and self.custom_rates:
-            # Determine symbols still in use.
-            other_args = set()
-            for custom_rate in itervalues(self.custom_rates):
-                other_args.update(custom_rate.atoms(sym.Symbol))
-
-            # Remove those that are not being used in any custom rate.
-            for arg in other_args:
-                if arg in args.copy():
-                    args.remove(arg)
-
-            for arg in args:
-                if arg not in standards and arg in self.custom_parameters:
-                    del self.custom_parameters[str(arg)]
+            # Remove those that are not being used in any other custom rate.
+            args.difference_update(
+                str(arg)
+                for custom_rate in itervalues(self.custom_rates)
+                for arg in custom_rate.free_symbols
+            )
+            for arg in args.intersection(self.custom_parameters):
+                del self.custom_parameters[arg]
 
         context = get_context(self)
         if context:
@@ -1037,15 +1118,23 @@ class MassModel(Model):
         context = get_context(self)
         if context:
             existing_customs = self.custom_rates.copy()
-            existing_parameters = self.parameters.copy()
+            existing_parameters = self.custom_parameters.copy()
 
-        self.custom_rates = {}
-        self.custom_parameters = {}
+        # Clear in place so undo operations bound to these dicts still apply
+        self.custom_rates.clear()
+        self.custom_parameters.clear()
         LOGGER.info("All custom rate expressions and parameters have been reset")
 
         if context:
-            context(partial(self.custom_parameters.update, existing_parameters))
-            context(partial(self.custom_parameters.update, existing_customs))
+            context(
+                partial(
+                    _bulk_undo,
+                    [
+                        (self.custom_rates.update, existing_customs),
+                        (self.custom_parameters.update, existing_parameters),
+                    ],
+                )
+            )
 
     def add_units(self, unit_defs):
         r"""Add a :class:`~.UnitDefinition` to the model :attr:`units`.
@@ -1072,7 +1161,7 @@ class MassModel(Model):
                     "'{0}' is not a valid UnitDefinition.".format(str(unit))
                 )
             # Skip existing units.
-            if unit.id in self.units.list_attr("id"):
+            if unit.id in self.units:
                 warnings.warn(
                     "Skipping '{0}' for it already exists in the" " model.".format(unit)
                 )
@@ -1145,7 +1234,7 @@ class MassModel(Model):
         array_type : str
             A string identifiying the desired format for the returned matrix.
             Valid matrix types include ``'dense'``, ``'dok'``, ``'lil'``,
-            ``'DataFrame'``, and ``'symbolic'``
+            ``'csr'``, ``'DataFrame'``, and ``'symbolic'``
             Default is ``'dense'``. See the :mod:`~.matrix` module
             documentation for more information on the ``array_type``.
         dtype : data-type
@@ -1160,50 +1249,39 @@ class MassModel(Model):
 
         """
         # Set up for matrix construction if matrix types are correct.
-        (matrix_constructor, array_type, dtype) = _get_matrix_constructor(
+        (_, array_type, dtype) = _get_matrix_constructor(
             array_type=array_type, dtype=dtype
         )
 
-        # Build the elemental matrix
-        elem_mat = matrix_constructor((len(CHOPNSQ), len(self.metabolites)))
-        # Get indices for elements and metabolites
-        e_ind = CHOPNSQ.index
-        m_ind = self.metabolites.index
-
-        # Fill the elemental matrix
-        moieties = []
-        for met in self.metabolites:
-            element_dict = met.elements
-            for element in CHOPNSQ:
-                if element in iterkeys(element_dict):
-                    amount = element_dict.pop(element)
-                elif re.match("q", element) and met.charge is not None:
-                    amount = met.charge
-                else:
-                    amount = 0
-                elem_mat[e_ind(element), m_ind(met)] = amount
-            # Get any additional moieties
-            moieties.extend(
-                [
-                    element
-                    for element in iterkeys(element_dict)
-                    if "[" in element and "]" in element and element not in moieties
-                ]
-            )
+        # Build the elemental matrix densely, then convert it to the type
+        elem_mat = np.zeros((len(CHOPNSQ), len(self.metabolites)))
+        # Get indices for elements
+        e_ind = {element: i for i, element in enumerate(CHOPNSQ)}
+
+        # Fill the elemental matrix in one pass over each metabolite's elements,
+        # parsing each distinct formula only once (e.g. across compartments).
+        moieties = {}
+        parsed_formulas = {}
+        for m_ind, met in enumerate(self.metabolites):
+            try:
+                element_dict = parsed_formulas[met.formula]
+            except KeyError:
+                element_dict = parsed_formulas[met.formula] = met.elements
+            for element, amount in iteritems(element_dict):
+                if element in e_ind:
+                    elem_mat[e_ind[element], m_ind] = amount
+                # Track additional moieties and the metabolites containing them
+                elif "[" in element and "]" in element:
+                    moieties.setdefault(element, []).append(m_ind)
+            if "q" not in element_dict and met.charge is not None:
+                elem_mat[e_ind["q"], m_ind] = met.charge
 
         row_ids = CHOPNSQ.copy()
         # Add additional moieties to the elemental matrix
         if moieties:
-            moiety_mat = matrix_constructor((len(moieties), len(self.metabolites)))
-            # Create additional matrix for moieties
-            for met in self.metabolites:
-                element_dict = met.elements
-                for element in moieties:
-                    if element in element_dict:
-                        amount = 1
-                    else:
-                        amount = 0
-                    moiety_mat[moieties.index(element), m_ind(met)] = amount
+            moiety_mat = np.zeros((len(moieties), len(self.metabolites)))
+            for i, m_inds in enumerate(itervalues(moieties)):
+                moiety_mat[i, m_inds] = 1
             # Concatenate matrices
             elem_mat = np.concatenate((elem_mat, moiety_mat), axis=0)
             row_ids.extend(moieties)
@@ -1227,7 +1305,7 @@ class MassModel(Model):
         array_type : str
             A string identifiying the desired format for the returned matrix.
             Valid matrix types include ``'dense'``, ``'dok'``, ``'lil'``,
-            ``'DataFrame'``, and ``'symbolic'``
+            ``'csr'``, ``'DataFrame'``, and ``'symbolic'``
             Default is ``'dense'``. See the :mod:`~.matrix` module
             documentation for more information on the ``array_type``.
         dtype : data-type
@@ -1329,7 +1407,11 @@ class MassModel(Model):
             if attr not in do_not_copy_by_ref:
                 new_model.__dict__[attr] = self.__dict__[attr]
 
-        for attr in do_not_copy_by_ref[-5:]:
+        # Boundary conditions and custom parameters only hold immutable
+        # values (numbers or sympy expressions), so shallow copies suffice.
+        for attr in ["boundary_conditions", "custom_parameters"]:
+            setattr(new_model, attr, getattr(self, attr).copy())
+        for attr in ["units", "notes", "annotation"]:
             setattr(new_model, attr, deepcopy(getattr(self, attr)))
 
         # Copy the metabolites
@@ -1346,17 +1428,15 @@ class MassModel(Model):
                     for reaction, custom_rate in iteritems(self.custom_rates)
                 }
             )
-        # Copy custom parameters
-        if self.custom_parameters:
-            new_model.custom_parameters.update(self.custom_parameters)
 
         # Copy any existing groups
         new_model.groups += self._copy_model_groups(new_model)
 
         # Copy any existing enzyme_modules
         new_model.enzyme_modules += self._copy_model_enzyme_modules(new_model)
-        # Create the new stoichiometric matrix for the model.
-        new_model._S = self._mk_stoich_matrix(
+        # Copy the stoichiometric matrix for the model, only rebuilding it
+        # if the stoichiometry changed since it was last created.
+        new_model._S = self.update_S(
             array_type=self._array_type, dtype=self._dtype, update_model=True
         )
 
@@ -1436,22 +1516,57 @@ class MassModel(Model):
 
         # Set the merged model object and its ID,
         # then add the module attribute of the right model into the left
-        new_model = super(MassModel, self).merge(
-            right, prefix_existing, inplace, objective
+        if inplace:
+            new_model = self
+        else:
+            new_model = self.copy()
+            new_model.id = "{0}_{1}".format(self.id, right.id)
+
+        # Copy the reactions object by object rather than through deepcopy,
+        # which would also copy the entire right model through its pointers.
+        new_reactions = right._copy_model_reactions(
+            None,
+            metabolites=right._copy_model_metabolites(None),
+            genes=right._copy_model_genes(None),
         )
+        if prefix_existing is not None:
+            existing = new_reactions.query(lambda rxn: rxn.id in self.reactions)
+            for reaction in existing:
+                reaction.id = "{0}{1}".format(prefix_existing, reaction.id)
+        new_model.add_reactions(new_reactions)
+
+        # Copy custom constraints and variables from the right model.
+        interface = new_model.problem
+        new_vars = [
+            interface.Variable.clone(v)
+            for v in right.variables
+            if v.name not in new_model.variables
+        ]
+        new_model.add_cons_vars(new_vars)
+        new_cons = [
+            interface.Constraint.clone(c, model=new_model.solver)
+            for c in right.constraints
+            if c.name not in new_model.constraints
+        ]
+        new_model.add_cons_vars(new_cons, sloppy=True)
+        new_model.objective = dict(
+            left=self.objective,
+            right=right.objective,
+            sum=self.objective.expression + right.objective.expression,
+        )[objective]
 
         # Add boundary conditions from right to left model.
-        existing = [bc for bc in iterkeys(new_model.boundary_conditions)]
+        existing = new_model.boundary_conditions
         new_model.add_boundary_conditions(
             {
                 m: bc
                 for m, bc in iteritems(right.boundary_conditions)
-                if bc not in existing
+                if m not in existing
             }
         )
 
         # Add custom parameters from right to left model.
-        existing = [cp for cp in iterkeys(new_model.custom_parameters)]
+        existing = new_model.custom_parameters
         new_model.custom_parameters.update(
             {
                 cp: v
@@ -1705,6 +1820,15 @@ class MassModel(Model):
 
         # Function to calculate the solution
         def calculate_sol(flux, rate_equation, perc):
+            slope = rate_equation.diff(perc)
+            if perc not in slope.free_symbols:
+                # Rate is linear in the PERC, solve directly without sympy
+                intercept = float(rate_equation.xreplace({perc: sym.S.Zero}))
+                slope = float(slope)
+                if slope == 0 or flux == intercept:
+                    return float(at_equilibrium_default)
+                return (flux - intercept) / slope
+
             sol = sym.solveset(sym.Eq(flux, rate_equation), perc, domain=sym.S.Reals)
             if (
                 isinstance(sol, type(sym.S.Reals))
@@ -1729,13 +1853,13 @@ class MassModel(Model):
                 continue
 
             # Get arguments
-            args = [
-                a for a in list(rate_eq.atoms(sym.Symbol)) if str(a) != reaction.kf_str
-            ]
+            args = [a for a in rate_eq.free_symbols if str(a) != reaction.kf_str]
 
             # Get numerical values for arguments
             vals = {
-                a: numerical_values[str(a)] for a in args if str(a) in numerical_values
+                a: sym.sympify(numerical_values[str(a)])
+                for a in args
+                if str(a) in numerical_values
             }
 
             if len(args) != len(vals):
@@ -1747,8 +1871,9 @@ class MassModel(Model):
                 )
                 continue
 
-            # Substitute values into rate equation
-            rate_eq = rate_eq.subs(vals)
+            # Substitute values into rate equation, replacing the symbols
+            # directly rather than through the slower pattern matching of subs
+            rate_eq = rate_eq.xreplace(vals)
             # Calculate rate equation and update with soluton for PERC
             sol = calculate_sol(flux, rate_eq, sym.Symbol(reaction.kf_str))
             percs_dict.update({reaction.kf_str: sol})
@@ -1827,7 +1952,8 @@ class MassModel(Model):
             if reaction_str.strip()
         ]
 
-        # Iterate through reaction strings
+        # Iterate through reaction strings, tracking the reactions built
+        built_reactions = []
         for orig_reaction_str in reaction_list:
             # Split the reaction ID from the reaction equation
             split = orig_reaction_str.split(reaction_id_split)
@@ -1855,6 +1981,7 @@ class MassModel(Model):
                 reaction.build_reaction_from_string(
                     reaction_str, verbose=verbose, **kwargs
                 )
+                built_reactions.append(reaction)
             except ValueError as e:
                 # Raise warnings for reactions that could not be built.
                 warnings.warn(
@@ -1862,8 +1989,13 @@ class MassModel(Model):
                     "{1}".format(orig_reaction_str, str(e))
                 )
                 continue
-        # Ensure all pointers are updated.
-        self.repair(rebuild_index=True, rebuild_relationships=True)
+        # Ensure pointers are updated for the reactions that were built,
+        # rather than rebuilding the relationships of the entire model.
+        for reaction in built_reactions:
+            reaction._model = self
+            for obj in chain(reaction._metabolites, reaction._genes):
+                obj._reaction.add(reaction)
+                obj._model = self
 
     def update_parameters(self, parameters, verbose=True):
         """Update the parameters associated with the MassModel.
@@ -1912,10 +2044,12 @@ class MassModel(Model):
             if not isinstance(key, string_types):
                 raise TypeError("Keys must be strings. '{0}' not a string.".format(key))
 
+        boundary_metabolites = set(self.boundary_metabolites)
+        boundary_conditions = {}
         for key, value in iteritems(parameters):
             # Check the parameter type
-            if key in self.boundary_metabolites:
-                self.add_boundary_conditions({key: value})
+            if key in boundary_metabolites:
+                boundary_conditions[key] = value
             elif key.split("_", 1)[0] in ["kf", "Keq", "kr", "v"]:
                 # See if the reaction exists and if none found, assume
                 # parameter is a custom parameter
@@ -1934,6 +2068,9 @@ class MassModel(Model):
             else:
                 self.custom_parameters.update({key: value})
 
+        if boundary_conditions:
+            self.add_boundary_conditions(boundary_conditions)
+
     def update_initial_conditions(self, initial_conditions, verbose=True):
         """Update the initial conditions of the model.
 
@@ -1959,6 +2096,9 @@ class MassModel(Model):
         """
         if not isinstance(initial_conditions, dict):
             raise TypeError("initial_conditions must be a dictionary.")
+        # Collect the previous values to register a single undo operation
+        context = get_context(self)
+        undo_ops = []
         for metabolite, ic_value in iteritems(initial_conditions):
             # Try getting metabolite object from model
             try:
@@ -1968,7 +2108,7 @@ class MassModel(Model):
                 continue
             # Try setting the initial condition
             try:
-                metabolite.initial_condition = ic_value
+                ic_value = ensure_non_negative_value(ic_value)
             except (TypeError, ValueError) as e:
                 if verbose:
                     warnings.warn(
@@ -1976,6 +2116,17 @@ class MassModel(Model):
                         "following: {1}".format(metabolite.id, str(e))
                     )
                 continue
+            if context and metabolite._initial_condition != ic_value:
+                undo_ops.append(
+                    (
+                        partial(setattr, metabolite, "_initial_condition"),
+                        metabolite._initial_condition,
+                    )
+                )
+            metabolite._initial_condition = ic_value
+
+        if undo_ops:
+            context(partial(_bulk_undo, undo_ops))
 
     def update_custom_rates(self, custom_rates, custom_parameters=None):
         r"""Update the custom rates of the model.
@@ -2173,7 +2324,45 @@ class MassModel(Model):
         if dtype is None:
             dtype = self._dtype
 
-        stoich_mat = create_stoichiometric_matrix(self)
+        # Assemble the nonzero entries directly into preallocated arrays,
+        # since the number of entries is known before filling them.
+        met_index = {met: i for i, met in enumerate(self.metabolites)}
+        stoichiometry = [rxn._metabolites for rxn in self.reactions]
+        nnz_per_rxn = np.fromiter(
+            map(len, stoichiometry), dtype=np.intp, count=len(stoichiometry)
+        )
+        nnz = int(nnz_per_rxn.sum())
+        rows = np.fromiter(
+            map(met_index.__getitem__, chain.from_iterable(stoichiometry)),
+            dtype=np.intp,
+            count=nnz,
+        )
+        data = np.fromiter(
+            chain.from_iterable(s.values() for s in stoichiometry),
+            dtype=np.float64,
+            count=nnz,
+        )
+        cols = np.repeat(np.arange(len(stoichiometry)), nnz_per_rxn)
+        # Store the entries in a requested numeric dtype (e.g. np.int8) before
+        # any densifying conversion so no float64 intermediate is allocated.
+        try:
+            data_dtype = np.dtype(dtype)
+        except TypeError:
+            data_dtype = data.dtype
+        if array_type != "symbolic" and np.issubdtype(data_dtype, np.number):
+            if np.issubdtype(data_dtype, np.integer) and not np.array_equal(
+                data.astype(data_dtype), data
+            ):
+                raise ValueError(
+                    "Stoichiometric coefficients cannot be represented exactly "
+                    "with dtype '{0}'.".format(data_dtype)
+                )
+            data = data.astype(data_dtype, copy=False)
+        stoich_mat = csr_matrix(
+            (data, (rows, cols)),
+            shape=(len(self.metabolites), len(self.reactions)),
+        )
+        stoich_mat.eliminate_zeros()
 
         # Convert the matrix to the desired type
         stoich_mat = convert_matrix(
@@ -2253,17 +2442,27 @@ class MassModel(Model):
 
         return new_genes
 
-    def _copy_model_reactions(self, new_model):
+    def _copy_model_reactions(self, new_model, metabolites=None, genes=None):
         """Copy the reactions in creating a partial "deepcopy" of model.
 
+        The copied reactions are associated with the given ``metabolites``
+        and ``genes``, which default to those of the ``new_model``.
+
         Warnings
         --------
         This method is intended for internal use only.
 
         """
+        if metabolites is None:
+            metabolites = new_model.metabolites
+        if genes is None:
+            genes = new_model.genes
         # Initialize DictList and set attributes to not copy by ref.
         new_reactions = DictList()
         do_not_copy_by_ref = {"_model", "_metabolites", "_genes"}
+        # Index the copied metabolites and genes once for remapping
+        new_metabolites = {met.id: met for met in metabolites}
+        new_genes = {gene.id: gene for gene in genes}
         # Copy the reactions
         for reaction in self.reactions:
             new_reaction = reaction.__class__()
@@ -2273,12 +2472,14 @@ class MassModel(Model):
             new_reaction._model = new_model
             new_reactions.append(new_reaction)
             # Update awareness for metabolites and genes
-            for metabolite, stoich in iteritems(reaction._metabolites):
-                new_metabolite = new_model.metabolites.get_by_id(metabolite.id)
-                new_reaction._metabolites[new_metabolite] = stoich
+            new_reaction._metabolites = {
+                new_metabolites[metabolite.id]: stoich
+                for metabolite, stoich in iteritems(reaction._metabolites)
+            }
+            for new_metabolite in new_reaction._metabolites:
                 new_metabolite._reaction.add(new_reaction)
             for gene in reaction._genes:
-                new_gene = new_model.genes.get_by_id(gene.id)
+                new_gene = new_genes[gene.id]
                 new_reaction._genes.add(new_gene)
                 new_gene._reaction.add(new_reaction)
 
@@ -2326,20 +2527,23 @@ class MassModel(Model):
                     new_group.__dict__[attr] = copy(value)
             new_group._model = new_model
             new_groups.append(new_group)
+        # Index the copied objects once for remapping
+        new_metabolites = {met.id: met for met in new_model.metabolites}
+        new_reactions = {rxn.id: rxn for rxn in new_model.reactions}
+        new_genes = {gene.id: gene for gene in new_model.genes}
         # Iterate through groups
-        for group in self.groups:
-            new_group = new_groups.get_by_id(group.id)
+        for group, new_group in zip(self.groups, new_groups):
             # Update awareness
             new_objects = []
             for member in group.members:
                 if isinstance(member, MassMetabolite):
-                    new_object = new_model.metabolites.get_by_id(member.id)
+                    new_object = new_metabolites[member.id]
                 elif isinstance(member, MassReaction):
-                    new_object = new_model.reactions.get_by_id(member.id)
+                    new_object = new_reactions[member.id]
                 elif isinstance(member, Gene):
-                    new_object = new_model.genes.get_by_id(member.id)
+                    new_object = new_genes[member.id]
                 elif isinstance(member, Group):
-                    new_object = new_model.genes.get_by_id(member.id)
+                    new_object = new_groups.get_by_id(member.id)
                 elif member.__class__.__name__ == "EnzymeModuleDict":
                     new_object = new_model.enzyme_modules.get_by_id(member.id)
                 else:
@@ -2362,65 +2566,37 @@ class MassModel(Model):
 
         """
         try:
-            dim_S = "{0}x{1}".format(self.S.shape[0], self.S.shape[1])
-            rank = matrix_rank(self.S)
+            # Access the matrix once for its dimensions, which also ensures
+            # the cached matrix reflects the current stoichiometry.
+            dim_S = "{0}x{1}".format(*self.S.shape)
+            # Only recompute the rank if the cached matrix has been rebuilt,
+            # densifying it once when it is sparse.
+            stoich_mat = _S_CACHE[self][1]
+            cached = _RANK_CACHE.get(self)
+            if cached is None or cached[0] is not stoich_mat:
+                cached = (stoich_mat, matrix_rank(stoich_mat))
+                _RANK_CACHE[self] = cached
+            rank = cached[1]
         except (np.linalg.LinAlgError, ValueError, IndexError):
             dim_S = "0x0"
             rank = 0
 
-        return """
-            <table>
-                <tr>
-                    <td><strong>Name</strong></td><td>{name}</td>
-                </tr><tr>
-                    <td><strong>Memory address</strong></td><td>{address}</td>
-                </tr><tr>
-                    <td><strong>Stoichiometric Matrix</strong></td>
-                    <td>{dim_stoich_mat}</td>
-                </tr><tr>
-                    <td><strong>Matrix Rank</strong></td>
-                    <td>{mat_rank}</td>
-                </tr><tr>
-                    <td><strong>Number of metabolites</strong></td>
-                    <td>{num_metabolites}</td>
-                </tr><tr>
-                    <td><strong>Initial conditions defined</strong></td>
-                    <td>{num_ic}/{num_metabolites}</td>
-                </tr><tr>
-                    <td><strong>Number of reactions</strong></td>
-                    <td>{num_reactions}</td>
-                </tr><tr>
-                    <td><strong>Number of genes</strong></td>
-                    <td>{num_genes}</td>
-                </tr><tr>
-                    <td><strong>Number of enzyme modules</strong></td>
-                    <td>{num_enzyme_modules}</td>
-                </tr><tr>
-                    <td><strong>Number of groups</strong></td>
-                    <td>{num_groups}</td>
-                </tr><tr>
-                    <td><strong>Objective expression</strong></td>
-                    <td>{objective}</td>
-                </tr><tr>
-                    <td><strong>Compartments</strong></td>
-                    <td>{compartments}</td>
-                </tr>
-            </table>
-        """.format(
+        return _HTML_TEMPLATE.format(
             name=self.id,
-            address="0x0%x" % id(self),
+            address=hex(id(self)),
             dim_stoich_mat=dim_S,
             mat_rank=rank,
             num_metabolites=len(self.metabolites),
-            num_ic=len(self.initial_conditions),
+            # Count initial conditions without building the dict of them
+            num_ic=sum(
+                1 for met in self.metabolites if met.initial_condition is not None
+            ),
             num_reactions=len(self.reactions),
             num_genes=len(self.genes),
             num_enzyme_modules=len(self.enzyme_modules),
             num_groups=len(self.groups),
             objective=format_long_string(str(self.objective.expression), 100),
-            compartments=", ".join(
-                v if v else k for k, v in iteritems(self.compartments)
-            ),
+            compartments=", ".join([v or k for k, v in iteritems(self.compartments)]),
         )
 
     def __setstate__(self, state):
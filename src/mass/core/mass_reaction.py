@@ -53,7 +53,7 @@ listed below:
 import re
 import warnings
 from copy import copy, deepcopy
-from functools import partial
+from functools import lru_cache, partial
 from operator import attrgetter
 
 from cobra.core.metabolite import Metabolite
@@ -69,6 +69,7 @@ from six import iteritems, itervalues, string_types
 from mass.core.mass_configuration import MassConfiguration
 from mass.core.mass_metabolite import MassMetabolite
 from mass.util.expressions import (
+    _clear_rate_expression_cache,
     generate_disequilibrium_ratio,
     generate_forward_mass_action_rate_expression,
     generate_mass_action_rate_expression,
@@ -85,6 +86,27 @@ from mass.util.util import (
 MASSCONFIGURATION = MassConfiguration()
 
 
+@lru_cache(maxsize=None)
+def _get_arrow_finder(reversible_arrow=None, rev_arrow=None):
+    """Return a single compiled pattern matching reversible and reverse arrows.
+
+    Warnings
+    --------
+    This method is intended for internal use only.
+
+    """
+    return re.compile(
+        "(?P<reversible>{0})|(?P<reverse>{1})".format(
+            _reversible_arrow_finder.pattern
+            if reversible_arrow is None
+            else re.escape(reversible_arrow),
+            _reverse_arrow_finder.pattern
+            if rev_arrow is None
+            else re.escape(rev_arrow),
+        )
+    )
+
+
 class MassReaction(Reaction):
     """Class for holding kinetic information regarding a biochemical reaction.
 
@@ -497,11 +519,12 @@ class MassReaction(Reaction):
 
         """
         if self.boundary:
-            for metabolite in self.metabolites:
-                bc_metabolite = metabolite._remove_compartment_from_id_str()
-                bc_metabolite += "_" + str(
-                    next(iter(MASSCONFIGURATION.boundary_compartment))
-                )
+            # Boundary reactions have exactly one metabolite
+            metabolite = next(iter(self._metabolites))
+            bc_metabolite = "{0}_{1}".format(
+                metabolite._remove_compartment_from_id_str(),
+                next(iter(MASSCONFIGURATION.boundary_compartment)),
+            )
         else:
             bc_metabolite = None
 
@@ -960,6 +983,7 @@ class MassReaction(Reaction):
             else:
                 # Input not recognized.
                 raise TypeError("Unrecognized input {0}".format(str(met)))
+        _clear_rate_expression_cache(self)
         try:
             super(MassReaction, self).add_metabolites(
                 metabolites_to_add, combine, reversibly
@@ -1155,28 +1179,22 @@ class MassReaction(Reaction):
                 term_split,
             )
 
-        reversible_arrow_finder = (
-            _reversible_arrow_finder
-            if reversible_arrow is None
-            else re.compile(re.escape(reversible_arrow))
-        )
-
-        reverse_arrow_finder = (
-            _reverse_arrow_finder
-            if rev_arrow is None
-            else re.compile(re.escape(rev_arrow))
-        )
+        # Scan the string once for both arrow types
+        arrows_found = {
+            match.lastgroup
+            for match in _get_arrow_finder(reversible_arrow, rev_arrow).finditer(
+                reaction_str
+            )
+        }
 
-        if not is_reversible and reversible_arrow_finder.search(reaction_str):
+        if not is_reversible and "reversible" in arrows_found:
             warnings.warn(
                 "Reaction '{0}' was previously set as `reversible=False`, but "
                 "now has `reversible=True` due to the inferred reaction arrow "
                 "in `reaction_str`.".format(self.id)
             )
 
-        if reverse_arrow_finder.search(
-            reaction_str
-        ) and not reversible_arrow_finder.search(reaction_str):
+        if arrows_found == {"reverse"}:
             # Reverse the stoichiometry of the reaction
             self.reverse_stoichiometry(inplace=True, reverse_bounds=True)
 
@@ -1314,7 +1332,7 @@ class MassReaction(Reaction):
         """.format(
             id=format_long_string(self.id, 100),
             name=format_long_string(self.name, 100),
-            address="0x0%x" % id(self),
+            address=hex(id(self)),
             subsystem=self.subsystem,
             reversibility=self._reversible,
             stoich_id=format_long_string(self.build_reaction_string(), 200),
@@ -278,8 +278,7 @@ class MassSolution(DictWithID):
             "deviation": deviation,
         }
         # Get current axis and clear it
-        ax = plt.gca()
-        ax.cla()
+        ax = _get_cleared_current_axes()
         # Plot time profile
         ax = plot_time_profile(self, ax=ax, legend="right outside", **options)
         # Set figure size
@@ -297,9 +296,8 @@ class MassSolution(DictWithID):
 
         """
         _validate_visualization_packages("matplotlib")
-        # Get current axis
-        ax = plt.gca()
-        ax.cla()
+        # Get current axis and clear it
+        ax = _get_cleared_current_axes()
         # Set options
         options = {
             "title": ("Tiled Phase portraits for " + self.id, {"size": "large"}),
@@ -443,4 +441,21 @@ class MassSolution(DictWithID):
         return list(iterkeys(self)) + super(MassSolution, self).__dir__()
 
 
+def _get_cleared_current_axes():
+    """Return the current axes, only clearing it if it already existed.
+
+    Warnings
+    --------
+    This method is intended for internal use only.
+
+    """
+    # An axes newly created by plt.gca() is already empty.
+    existing = bool(plt.get_fignums()) and bool(plt.gcf().axes)
+    ax = plt.gca()
+    if existing:
+        ax.cla()
+
+    return ax
+
+
 __all__ = ("MassSolution",)
@@ -48,7 +48,6 @@ then stored in the :attr:`.MassModel.enzyme_modules` attribute for access at
 a later time. See the :mod:`~.enzyme_module_dict` documentation for more
 information about the :class:`~.EnzymeModuleDict`.
 """
-import re
 from copy import copy, deepcopy
 from functools import partial
 from warnings import warn
@@ -69,10 +68,6 @@ from mass.util.matrix import matrix_rank
 from mass.util.util import _mk_new_dictlist, ensure_iterable, ensure_non_negative_value
 
 
-_AUTOMATIC_RE = re.compile("^automatic$")
-_EQUATION_RE = re.compile("^Equation$")
-
-
 class EnzymeModule(MassModel):
     r"""Class representation of an enzyme module reconstruction.
 
@@ -90,7 +85,8 @@ class EnzymeModule(MassModel):
     array_type : str
         A string identifiying the desired format for the returned matrix.
         Valid matrix types include ``'dense'``, ``'dok'``, ``'lil'``,
-        ``'DataFrame'``, and ``'symbolic'`` Default is ``'DataFrame'``.
+        ``'csr'``, ``'DataFrame'``, and ``'symbolic'``
+        Default is ``'DataFrame'``.
         See the :mod:`~.matrix` module documentation for more information
         on the ``array_type``.
     dtype : data-type
@@ -474,7 +470,7 @@ class EnzymeModule(MassModel):
             compartment=compartment,
         )
         # Generate name for the EnzymeModuleForm if name set to "automatic"
-        if _AUTOMATIC_RE.match(name.lower()):
+        if name.lower() == "automatic":
             enzyme_module_forms.generate_enzyme_module_form_name(True)
 
         # Add the enzyme forms to the module and place in respective
@@ -573,7 +569,7 @@ class EnzymeModule(MassModel):
                 self.enzyme_module_reactions_categorized = {category: new_reaction}
 
         # Set enzyme name if set to automatic
-        if _AUTOMATIC_RE.match(name.lower()):
+        if name.lower() == "automatic":
             name = new_reaction.generate_enzyme_module_reaction_name(True)
 
         return new_reaction
@@ -957,7 +953,7 @@ class EnzymeModule(MassModel):
                 summation_expr = self._make_summation_expr(
                     attr_dictlist.get_by_id(category).members, object_type
                 )
-            elif _EQUATION_RE.match(category):
+            elif category == "Equation":
                 # Get equation if category is "Equation"
                 summation_expr = {
                     "forms": self.enzyme_concentration_total_equation,
@@ -1785,21 +1781,22 @@ class EnzymeModule(MassModel):
             </table>
         """.format(
             name=self.id,
-            address="0x0%x" % id(self),
+            address=hex(id(self)),
             dim_stoich_mat=dim_S,
             mat_rank=rank,
             subsystem=self.subsystem,
             num_enzyme_module_ligands=len(self.enzyme_module_ligands),
             num_enz_forms=len(self.enzyme_module_forms),
-            num_ic=len(self.initial_conditions),
+            # Count initial conditions without building the dict of them
+            num_ic=sum(
+                1 for met in self.metabolites if met.initial_condition is not None
+            ),
             num_metabolites=len(self.metabolites),
             num_enz_reactions=len(self.enzyme_module_reactions),
             enz_conc=self.enzyme_concentration_total,
             enz_flux=self.enzyme_rate,
             num_groups=len(self.groups),
-            compartments=", ".join(
-                v if v else k for k, v in iteritems(self.compartments)
-            ),
+            compartments=", ".join([v or k for k, v in iteritems(self.compartments)]),
         )
 
 
@@ -49,6 +49,7 @@ import numpy as np
 import pandas as pd
 from cobra.core.dictlist import DictList
 from cobra.core.group import Group
+from scipy.sparse import csr_matrix
 from six import iteritems, iterkeys, itervalues
 
 from mass.util.dict_with_id import OrderedDictWithID
@@ -146,7 +147,8 @@ class EnzymeModuleDict(OrderedDictWithID):
         """
         for key, value in iteritems(_ORDERED_ENZYMEMODULE_DICT_DEFAULTS):
             if key not in self:
-                self[key] = value
+                # Copy so mutable defaults are not shared between instances
+                self[key] = copy(value)
 
     def _update_object_pointers(self, model=None):
         """Update objects in the EnzymeModuleDict to point to the given model.
@@ -192,7 +194,7 @@ class EnzymeModuleDict(OrderedDictWithID):
 
         """
         # Set up for matrix construction.
-        (matrix_constructor, array_type, dtype) = _get_matrix_constructor(
+        (_, array_type, dtype) = _get_matrix_constructor(
             array_type="DataFrame", dtype=np.float_
         )
 
@@ -203,18 +205,20 @@ class EnzymeModuleDict(OrderedDictWithID):
                 for met in self[attr]
             ]
         )
-
-        stoich_mat = matrix_constructor(
-            (len(metabolites), len(self.enzyme_module_reactions))
+        # Get the indicies for the forms
+        m_ind = {met.id: i for i, met in enumerate(metabolites)}
+
+        # Assemble the nonzero entries in one pass over the reactions
+        rows, cols, data = [], [], []
+        for r_ind, rxn in enumerate(self.enzyme_module_reactions):
+            for met, stoich in iteritems(rxn._metabolites):
+                rows.append(m_ind[met.id])
+                cols.append(r_ind)
+                data.append(stoich)
+        stoich_mat = csr_matrix(
+            (np.array(data, dtype=np.float64), (rows, cols)),
+            shape=(len(metabolites), len(self.enzyme_module_reactions)),
         )
-        # Get the indicies for the forms and reactions
-        m_ind = metabolites.index
-        r_ind = self.enzyme_module_reactions.index
-
-        # Build the matrix
-        for rxn in self.enzyme_module_reactions:
-            for met, stoich in iteritems(rxn.metabolites):
-                stoich_mat[m_ind(met), r_ind(rxn)] = stoich
 
         # Convert the matrix to the desired type
         stoich_mat = convert_matrix(
@@ -291,7 +295,7 @@ class EnzymeModuleDict(OrderedDictWithID):
             </table>
         """.format(
             name=self.id,
-            address="0x0%x" % id(self),
+            address=hex(id(self)),
             dim_stoich_mat=dim_S,
             mat_rank=rank,
             subsystem=self.subsystem,
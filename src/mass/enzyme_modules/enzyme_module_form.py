@@ -356,13 +356,13 @@ class EnzymeModuleForm(MassMetabolite):
         </table>""".format(
             id=self.id,
             name=self.name,
-            address="0x0%x" % id(self),
+            address=hex(id(self)),
             enzyme=str(self.enzyme_module_id),
             compartment=self.compartment,
             bound=_make_bound_attr_str_repr(self.bound_metabolites),
             ic=self._initial_condition,
             n_reactions=len(self.reactions),
-            reactions=", ".join(r.id for r in self.reactions),
+            reactions=", ".join([r.id for r in self.reactions]),
         )
 
 
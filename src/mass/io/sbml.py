@@ -374,14 +374,8 @@ def _f_moiety_formula_rev(metabolite):
 
 def _remove_char_from_id(sid):
     """Remove ASCII characters from an identifier."""
-    for match in CHAR_RE.finditer(sid):
-        char_key = match.group("char")
-        if ASCII_REPLACE.get(char_key):
-            replacement_str = ASCII_REPLACE[char_key]
-        else:
-            replacement_str = "_"
-        sid = re.sub(char_key, replacement_str, sid)
-    return sid
+    # Replace every encoded character in a single pass over the identifier
+    return CHAR_RE.sub(lambda match: ASCII_REPLACE.get(match.group("char")) or "_", sid)
 
 
 def _get_corrected_id(item, f_items, obj_type, remove_char):
@@ -1010,8 +1004,8 @@ def _read_global_parameters_from_sbml(model, reactions, f_replace, **kwargs):
 
         try:
             p_type, rid = pid.split("_", 1)
-            if re.search(p_type, rid):
-                p_type = re.sub(rid, "", p_type)
+            if p_type in rid:
+                p_type = p_type.replace(rid, "")
             rid = _get_corrected_id(
                 rid, (f_replace, F_REACTION), None, kwargs.get("remove_char")
             )
@@ -1433,7 +1427,7 @@ def _read_reaction_kinetic_law_from_sbml(reaction, mass_reaction, f_replace, **k
             arg = str(arg)
             new_arg = arg
             # Check if reaction is in the name of the parameter
-            if re.search(sbml_rid, arg) and sbml_rid != mass_rid:
+            if sbml_rid in arg and sbml_rid != mass_rid:
                 new_arg = _get_corrected_id(
                     new_arg,
                     (sbml_rid, mass_rid, arg),
@@ -1455,7 +1449,7 @@ def _read_reaction_kinetic_law_from_sbml(reaction, mass_reaction, f_replace, **k
                 local_parameter, local_parameter.getIdAttribute(), "id"
             )
             value = local_parameter.getValue()
-            if re.search(sbml_rid, pid) and sbml_rid != mass_rid:
+            if sbml_rid in pid and sbml_rid != mass_rid:
                 pid = _get_corrected_id(
                     pid,
                     (sbml_rid, mass_rid, pid),
@@ -2118,7 +2112,7 @@ def _write_model_meta_info_to_sbml(doc, mass_model, model):
     # Check if there are creators
     creators = meta["creators"] if meta.get("creators") else []
 
-    mass_creator = MASSCONFIGURATION.model_creator
+    mass_creator = dict(MASSCONFIGURATION.model_creator)
     # Add creator in MassConfiguration if it doesn't already exist.
     if not any([mass_creator == c for c in creators]) and all(
         [v != "" for v in itervalues(mass_creator)]
@@ -2336,6 +2330,7 @@ def _write_model_kinetic_parameters_to_sbml(model, mass_model, f_replace, **kwar
 
     """
     local_parameters = kwargs.get("local_parameters")
+    reaction_ids = mass_model.reactions.list_attr("id")
     for parameter_type, parameter_dict in iteritems(mass_model.parameters):
         # Skip over parameters already written into the model.
         if local_parameters and parameter_type != "v":
@@ -2363,14 +2358,10 @@ def _write_model_kinetic_parameters_to_sbml(model, mass_model, f_replace, **kwar
                 rid = getattr(mass_model.reactions.get_by_id(rid), "id")
             except (ValueError, KeyError):
                 if f_replace and F_REACTION_REV in f_replace:
-                    m_rid = [
-                        m_rid
-                        for m_rid in mass_model.reactions.list_attr("id")
-                        if re.search(m_rid, pid)
-                    ]
+                    m_rid = [m_rid for m_rid in reaction_ids if m_rid in pid]
                     if m_rid:
                         m_rid = max(m_rid, key=len)
-                        pid = re.sub(m_rid, f_replace[F_REACTION_REV](m_rid), pid)
+                        pid = pid.replace(m_rid, f_replace[F_REACTION_REV](m_rid))
             else:
                 if f_replace and F_REACTION_REV in f_replace:
                     rid = f_replace[F_REACTION_REV](rid)
@@ -2735,9 +2726,9 @@ def _write_reaction_kinetic_law_to_sbml(reaction, mass_reaction, f_replace, **kw
         arg = str(arg)
         new_arg = arg
         # Check if reaction is in the name of the parameter
-        if re.search(mass_rid, arg) or arg in mass_reaction.model.boundary_conditions:
-            if re.search(mass_rid, arg):
-                new_arg = re.sub(mass_rid, rid, new_arg)
+        if mass_rid in arg or arg in mass_reaction.model.boundary_conditions:
+            if mass_rid in arg:
+                new_arg = new_arg.replace(mass_rid, rid)
 
             if kwargs.get("local_parameters"):
                 _create_local_parameter(arg, new_arg, sbo=None, udef=None, **kwargs)
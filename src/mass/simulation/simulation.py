@@ -1000,6 +1000,8 @@ class Simulation(Object):
         if perturbations:
             _log_msg(LOGGER, logging.INFO, verbose, "Parsing perturbations")
             sim_values = self._get_all_values_for_sim(self.reference_model)
+            # Determine the boundary metabolites once for all perturbations
+            boundary_metabolites = set(self.reference_model.boundary_metabolites)
 
             for key, value in iteritems(perturbations):
                 # Ensure key exists in model values
@@ -1014,9 +1016,7 @@ class Simulation(Object):
                 except (ValueError, TypeError):
                     # Value could not be interpreted as a float, therefore
                     # ensure it is valid as a sympy expression
-                    if key in self.reference_model.boundary_metabolites or key in str(
-                        value
-                    ):
+                    if key in boundary_metabolites or key in str(value):
                         value = sympify(value, locals={key: Symbol(key)})
                     else:
                         raise ValueError(
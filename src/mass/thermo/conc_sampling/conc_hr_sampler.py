@@ -370,9 +370,11 @@ class ConcHRSampler:
         # Avoid zero rows being correlated with constant rows
         extra_col[matrix.sum(axis=1) == 0] = 2
         corr = np.corrcoef(np.c_[matrix, extra_col])
-        corr = np.tril(corr, -1)
+        # Compare in place and only take the lower triangle of the boolean
+        # result to avoid full-size float temporaries.
+        np.abs(corr, out=corr)
 
-        return (np.abs(corr) > cutoff).any(axis=1)
+        return np.tril(corr > cutoff, -1).any(axis=1)
 
     def _bounds_dist(self, p):
         """Get the lower and upper bound distances. Negative is bad.
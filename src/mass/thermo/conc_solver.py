@@ -59,7 +59,7 @@ from cobra.exceptions import (
 from cobra.util.context import get_context, resettable
 from cobra.util.solver import get_solver_name, interface_to_str, qp_solvers, solvers
 from optlang.symbolics import Zero
-from scipy.sparse import dok_matrix, lil_matrix
+from scipy.sparse import csr_matrix, dok_matrix, lil_matrix
 from six import iteritems, string_types
 from sympy import Basic, Matrix, eye
 
@@ -614,14 +614,15 @@ class ConcSolver:
             kwargs,
         )
 
-        # Get fixed variables
-        fixed_conc_bounds = kwargs.pop("fixed_conc_bounds")
-        fixed_Keq_bounds = kwargs.pop("fixed_Keq_bounds")
+        # Get fixed variables as sets for constant time membership checks
+        fixed_conc_bounds = set(ensure_iterable(kwargs.pop("fixed_conc_bounds")))
+        fixed_Keq_bounds = set(ensure_iterable(kwargs.pop("fixed_Keq_bounds")))
 
-        # Get list of included metabolites, reactions, and Keq_strs
+        # Get list of included metabolites, reactions, and map Keq_strs to
+        # their reactions for constant time lookups.
         metabolites = self._get_included_metabolites(metabolites)
         reactions = self._get_included_reactions(reactions)
-        Keq_strs = reactions.list_attr("Keq_str")
+        Keq_strs = {rxn.Keq_str: rxn for rxn in reactions}
 
         for var in self.variables:
             if var.name in metabolites:
@@ -634,7 +635,7 @@ class ConcSolver:
                         "variable bounds set",
                         met.id,
                     )
-                elif any([m in fixed_conc_bounds for m in [met, met.id]]):
+                elif met in fixed_conc_bounds or met.id in fixed_conc_bounds:
                     bounds = (met.initial_condition, met.initial_condition)
                 else:
                     bounds = (conc_percent_deviation, conc_percent_deviation)
@@ -642,13 +643,13 @@ class ConcSolver:
                 upper_def = np.inf
             elif var.name in Keq_strs:
                 # Set bounds if reaction Keq variable
-                rxn = reactions[Keq_strs.index(var.name)]
+                rxn = Keq_strs[var.name]
                 if rxn.Keq is None:
                     bounds = (0, np.inf)
                     LOGGER.info(
                         "No Keq defined for '%s', no variable bounds " "set", rxn.id
                     )
-                elif any([r in fixed_Keq_bounds for r in [rxn, rxn.id, rxn.Keq_str]]):
+                elif not fixed_Keq_bounds.isdisjoint([rxn, rxn.id, rxn.Keq_str]):
                     bounds = (rxn.Keq, rxn.Keq)
                 else:
                     bounds = (Keq_percent_deviation, Keq_percent_deviation)
@@ -733,14 +734,15 @@ class ConcSolver:
             kwargs,
         )
 
-        # Get fixed variables
-        fixed_conc_bounds = kwargs.pop("fixed_conc_bounds")
-        fixed_Keq_bounds = kwargs.pop("fixed_Keq_bounds")
+        # Get fixed variables as sets for constant time membership checks
+        fixed_conc_bounds = set(ensure_iterable(kwargs.pop("fixed_conc_bounds")))
+        fixed_Keq_bounds = set(ensure_iterable(kwargs.pop("fixed_Keq_bounds")))
 
-        # Get list of included metabolites, reactions, and Keq_strs
+        # Get list of included metabolites, reactions, and map Keq_strs to
+        # their reactions for constant time lookups.
         metabolites = self._get_included_metabolites(metabolites)
         reactions = self._get_included_reactions(reactions)
-        Keq_strs = reactions.list_attr("Keq_str")
+        Keq_strs = {rxn.Keq_str: rxn for rxn in reactions}
 
         # Initialize lists for x_vars and x_data for QP objective
         x_vars = []
@@ -756,7 +758,7 @@ class ConcSolver:
                         met.id,
                     )
                     continue
-                if any([m in fixed_conc_bounds for m in [met, met.id]]):
+                if met in fixed_conc_bounds or met.id in fixed_conc_bounds:
                     bounds = (met.initial_condition, met.initial_condition)
                 else:
                     bounds = (0, np.inf)
@@ -764,8 +766,8 @@ class ConcSolver:
                 x_vars.append(var)
             elif var.name in Keq_strs:
                 # Set bounds if reaction Keq variable
-                rxn = reactions[Keq_strs.index(var.name)]
-                if any([r in fixed_Keq_bounds for r in [rxn.id, rxn.Keq_str]]):
+                rxn = Keq_strs[var.name]
+                if rxn.id in fixed_Keq_bounds or rxn.Keq_str in fixed_Keq_bounds:
                     bounds = (rxn.Keq, rxn.Keq)
                 else:
                     bounds = (0, np.inf)
@@ -1541,7 +1543,7 @@ class ConcSolver:
             )
 
         var_and_coeffs = {}
-        for metabolite, coefficient in iteritems(reaction.metabolites):
+        for metabolite, coefficient in iteritems(reaction._metabolites):
             if metabolite.id in self.excluded_metabolites:
                 continue
             try:
@@ -1669,15 +1671,15 @@ class ConcSolver:
             self.solver.objective = interface.Objective(Zero)
             self.problem_type = ""
 
-        # Get fixed variables
-        fixed_conc_bounds = kwargs.pop("fixed_conc_bounds")
-        fixed_Keq_bounds = kwargs.pop("fixed_Keq_bounds")
+        # Get fixed variables as sets for constant time membership checks
+        fixed_conc_bounds = set(ensure_iterable(kwargs.pop("fixed_conc_bounds")))
+        fixed_Keq_bounds = set(ensure_iterable(kwargs.pop("fixed_Keq_bounds")))
 
         # Get concentration variables for the solver,
         # filtering out those to be excluded.
         metabolites = self._get_included_metabolites()
         for met in metabolites:
-            if any([m in fixed_conc_bounds for m in [met, met.id]]):
+            if met in fixed_conc_bounds or met.id in fixed_conc_bounds:
                 lb, ub = (0, 0)
                 bound_type = "deviation"
             else:
@@ -1876,7 +1878,7 @@ def concentration_constraint_matricies(
     array_type : str
         A string identifiying the desired format for the returned matrix.
         Valid matrix types include ``'dense'``, ``'dok'``, ``'lil'``,
-        ``'DataFrame'``, and ``'symbolic'``
+        ``'csr'``, ``'DataFrame'``, and ``'symbolic'``
         Default is the current ``dense``. See the :mod:`~.matrix`
         module documentation for more information on the ``array_type``.
     zero_tol : float
@@ -1909,6 +1911,7 @@ def concentration_constraint_matricies(
             "dense": np.array,
             "dok": dok_matrix,
             "lil": lil_matrix,
+            "csr": csr_matrix,
             "DataFrame": pd.DataFrame,
             "symbolic": Matrix,
         }[array_type]
@@ -1,17 +1,56 @@
 # -*- coding: utf-8 -*-
 """Handles generation and manipulation of :mod:`sympy` expressions."""
 import re
+from functools import lru_cache
 from warnings import warn
+from weakref import WeakKeyDictionary
 
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+try:
+    import symengine
+except ImportError:
+    symengine = None
+
+import numpy as np
 import sympy as sym
-from six import iteritems, iterkeys, string_types
 from sympy.physics.vector import dynamicsymbols
 
 from mass.core.mass_configuration import MassConfiguration
+from mass.util.util import ensure_iterable
 
 
 MASSCONFIGURATION = MassConfiguration()
 
+_IDENTIFIER_RE = re.compile(r"[A-Za-z_]\w*")
+"""re.Pattern: Pattern matching identifiers in a string expression."""
+
+_RATE_EXPRESSION_CACHE = WeakKeyDictionary()
+"""WeakKeyDictionary: Generated mass action rates and ratios per reaction."""
+
+_ODES_CACHE = WeakKeyDictionary()
+"""WeakKeyDictionary: Generated ODEs per model with the key they were built for."""
+
+_FORWARD_RATE_CONSTANTS = (
+    None,
+    (("kf_str", 1),),
+    (("kf_str", 1),),
+    (("kr_str", 1), ("Keq_str", 1)),
+)
+"""tuple: Rate constant attributes and exponents of forward rates by type."""
+
+_REVERSE_RATE_CONSTANTS = (
+    None,
+    (("kf_str", 1), ("Keq_str", -1)),
+    (("kr_str", 1),),
+    (("kr_str", 1),),
+)
+"""tuple: Rate constant attributes and exponents of reverse rates by type."""
+
 
 # Public
 def Keq2k(sympy_expr, simplify=False):
@@ -37,9 +76,9 @@ def Keq2k(sympy_expr, simplify=False):
     def _replace_Keq(expr, simplify):
         """Replace the Keq symbol with kf/kr."""
         identifiers = [
-            str(symbol).split("_", 1)[1]
-            for symbol in list(expr.atoms(sym.Symbol))
-            if str(symbol).startswith("Keq_")
+            symbol.name.split("_", 1)[1]
+            for symbol in expr.atoms(sym.Symbol)
+            if symbol.name.startswith("Keq_")
         ]
         # Return the expression if no Keq found.
         if not identifiers:
@@ -49,7 +88,7 @@ def Keq2k(sympy_expr, simplify=False):
         # Create substitution dict
         for pid in identifiers:
             kf, kr, Keq = (
-                sym.Symbol(param_type + "_" + str(pid))
+                _mk_symbol(param_type + "_" + str(pid))
                 for param_type in ["kf", "kr", "Keq"]
             )
             substituion_dict[Keq] = kf / kr
@@ -94,9 +133,9 @@ def k2Keq(sympy_expr, simplify=False):
         if not isinstance(expr, sym.Basic):
             raise TypeError("{0} is not a sympy expression".format(str(expr)))
         identifiers = [
-            str(symbol).split("_", 1)[1]
-            for symbol in list(expr.atoms(sym.Symbol))
-            if str(symbol).startswith("kr_")
+            symbol.name.split("_", 1)[1]
+            for symbol in expr.atoms(sym.Symbol)
+            if symbol.name.startswith("kr_")
         ]
         # Return the expression if no kr found.
         if not identifiers:
@@ -106,7 +145,7 @@ def k2Keq(sympy_expr, simplify=False):
         # Create substitution dict
         for pid in identifiers:
             kf, kr, Keq = (
-                sym.Symbol(param_type + "_" + str(pid))
+                _mk_symbol(param_type + "_" + str(pid))
                 for param_type in ["kf", "kr", "Keq"]
             )
             substituion_dict[kr] = kf / Keq
@@ -143,21 +182,29 @@ def strip_time(sympy_expr):
         returned as the same type as the original input.
 
     """
+    # Functions of time mapped to their replacement symbols, shared by all of
+    # the expressions being stripped.
+    subs_dict = {}
+    time = _mk_symbol("t")
+
     # Helper function to strip a single expression
     def _strip_single_expr(expr):
         if not isinstance(expr, sym.Basic):
             raise TypeError("{0} is not a sympy expression".format(str(expr)))
+        funcs = expr.atoms(sym.Function)
+        # Nothing to replace in expressions without functions.
+        if not funcs:
+            return expr
         # Get the functions of only time.
-        subs_dict = {}
-        funcs = list(expr.atoms(sym.Function))
         for func in funcs:
-            if len(func.atoms(sym.Function)) == 1 and func.atoms(
-                sym.Symbol
-            ).pop() == sym.Symbol("t"):
+            if func in subs_dict:
+                continue
+            if func.atoms(sym.Symbol, sym.Function) == {func, time}:
                 # Make symbol to replace function
-                subs_dict[func] = sym.Symbol(str(func)[:-3])
-        # Substitute functions for symbols
-        new_expr = expr.subs(subs_dict)
+                subs_dict[func] = _mk_symbol(func.func.__name__)
+        # Substitute functions for symbols. A direct replacement is used since
+        # swapping a function for a symbol never requires re-evaluation.
+        new_expr = expr.xreplace(subs_dict)
 
         return new_expr
 
@@ -195,21 +242,36 @@ def generate_mass_action_rate_expression(reaction, rate_type=1):
         metabolites associated, ``None`` will be returned.
 
     """
-    if not reaction.metabolites:
+    if not reaction._metabolites:
         warn("No metabolites exist in reaction '{0}'.".format(reaction.id))
         return None
 
+    # Return the previously generated rate if nothing affecting it has changed
+    cache_key = _make_rate_cache_key(reaction, rate_type)
+    reaction_cache = _RATE_EXPRESSION_CACHE.setdefault(reaction, {})
+    if cache_key in reaction_cache:
+        return reaction_cache[cache_key]
+
+    # Get the metabolites once for both the forward and reverse rates
+    reactants, products, boundary_metabolite = _get_metabolites_for_rate(reaction)
+
     # Generate forward rate expression
-    fwd_rate = generate_forward_mass_action_rate_expression(reaction, rate_type)
+    fwd_rate = _generate_one_way_rate(
+        reaction, rate_type, reactants, boundary_metabolite, _FORWARD_RATE_CONSTANTS
+    )
 
     # Ignore reverse rate if it is mathematically equal to 0, or if
     # the equilibrium and rate constants are None and reaction is irreversible
     if not reaction.reversible:
-        rate_expression = fwd_rate
-    else:
-        # Generate reverse rate expression
-        rev_rate = generate_reverse_mass_action_rate_expression(reaction, rate_type)
-        rate_expression = sym.Add(fwd_rate, sym.Mul(-sym.S.One, rev_rate))
+        # A single product of terms has nothing to group, skip collecting
+        reaction_cache[cache_key] = fwd_rate
+        return fwd_rate
+
+    # Generate reverse rate expression
+    rev_rate = _generate_one_way_rate(
+        reaction, rate_type, products, boundary_metabolite, _REVERSE_RATE_CONSTANTS
+    )
+    rate_expression = sym.Add(fwd_rate, sym.Mul(-sym.S.One, rev_rate))
 
     # Try to group the forward rate constants
     if rate_type == 1:
@@ -220,6 +282,7 @@ def generate_mass_action_rate_expression(reaction, rate_type=1):
         for c in list(reaction.compartments):
             rate_expression = sym.collect(rate_expression, "volume_" + c)
 
+    reaction_cache[cache_key] = rate_expression
     return rate_expression
 
 
@@ -248,31 +311,14 @@ def generate_forward_mass_action_rate_expression(reaction, rate_type=1):
         has no metabolites associated, ``None`` will be returned.
 
     """
-    if not reaction.metabolites:
+    if not reaction._metabolites:
         warn("No metabolites exist in reaction '{0}'.".format(reaction.id))
         return None
 
-    if MASSCONFIGURATION.exclude_metabolites_from_rates and not reaction.boundary:
-        reaction = _remove_metabolites_from_rate(reaction)
-
-    fwd_rate = _format_metabs_sym(sym.S.One, reaction, reaction.reactants)
-    if rate_type == 3:
-        fwd_rate = sym.Mul(
-            sym.Mul(sym.var(reaction.kr_str), sym.var(reaction.Keq_str)), fwd_rate
-        )
-    else:
-        fwd_rate = sym.Mul(sym.var(reaction.kf_str), fwd_rate)
-
-    # Remove time dependency from fixed metabolites
-    fwd_rate = _set_fixed_metabolites_in_rate(reaction, fwd_rate)
-
-    # Add compartments
-    if not MASSCONFIGURATION.exclude_compartment_volumes_in_rates:
-        compartments = set(
-            met.compartment for met in reaction.reactants if met is not None
-        )
-        for c in list(compartments):
-            fwd_rate = sym.Mul(fwd_rate, sym.Symbol("volume_" + c))
+    reactants, _, boundary_metabolite = _get_metabolites_for_rate(reaction)
+    fwd_rate = _generate_one_way_rate(
+        reaction, rate_type, reactants, boundary_metabolite, _FORWARD_RATE_CONSTANTS
+    )
 
     return fwd_rate
 
@@ -302,32 +348,14 @@ def generate_reverse_mass_action_rate_expression(reaction, rate_type=1):
         has no metabolites associated, ``None`` will be returned.
 
     """
-    if not reaction.metabolites:
+    if not reaction._metabolites:
         warn("No metabolites exist in reaction '{0}'.".format(reaction.id))
         return None
 
-    if MASSCONFIGURATION.exclude_metabolites_from_rates and not reaction.boundary:
-        reaction = _remove_metabolites_from_rate(reaction)
-
-    rev_rate = _format_metabs_sym(sym.S.One, reaction, reaction.products)
-    if rate_type == 1:
-        rev_rate = sym.Mul(
-            sym.Mul(sym.var(reaction.kf_str), sym.Pow(sym.var(reaction.Keq_str), -1)),
-            rev_rate,
-        )
-    else:
-        rev_rate = sym.Mul(sym.var(reaction.kr_str), rev_rate)
-
-    # Remove time dependency from fixed metabolites
-    rev_rate = _set_fixed_metabolites_in_rate(reaction, rev_rate)
-
-    # Add compartments
-    if not MASSCONFIGURATION.exclude_compartment_volumes_in_rates:
-        compartments = set(
-            met.compartment for met in reaction.products if met is not None
-        )
-        for c in list(compartments):
-            rev_rate = sym.Mul(rev_rate, sym.Symbol("volume_" + c))
+    _, products, boundary_metabolite = _get_metabolites_for_rate(reaction)
+    rev_rate = _generate_one_way_rate(
+        reaction, rate_type, products, boundary_metabolite, _REVERSE_RATE_CONSTANTS
+    )
 
     return rev_rate
 
@@ -346,16 +374,22 @@ def generate_mass_action_ratio(reaction):
         The mass action ratio as a :mod:`sympy` expression.
 
     """
-    if MASSCONFIGURATION.exclude_metabolites_from_rates and not reaction.boundary:
-        reaction = _remove_metabolites_from_rate(reaction)
+    # Return the previously generated ratio if nothing affecting it has changed
+    cache_key = _make_rate_cache_key(reaction, "mass_action_ratio")
+    reaction_cache = _RATE_EXPRESSION_CACHE.setdefault(reaction, {})
+    if cache_key in reaction_cache:
+        return reaction_cache[cache_key]
+
+    reactants, products, boundary_metabolite = _get_metabolites_for_rate(reaction)
 
     # Handle reactants
-    r_bits = _format_metabs_sym(sym.S.One, reaction, reaction.reactants)
+    r_bits = _format_metabs_sym(sym.S.One, reaction, reactants, boundary_metabolite)
     # Handle products
-    p_bits = _format_metabs_sym(sym.S.One, reaction, reaction.products)
+    p_bits = _format_metabs_sym(sym.S.One, reaction, products, boundary_metabolite)
     # Combine to make the mass action ratio
     ma_ratio = sym.Mul(p_bits, sym.Pow(r_bits, -1))
 
+    reaction_cache[cache_key] = ma_ratio
     return ma_ratio
 
 
@@ -373,10 +407,17 @@ def generate_disequilibrium_ratio(reaction):
         The disequilibrium ratio as a :mod:`sympy` expression.
 
     """
+    # Return the previously generated ratio if nothing affecting it has changed
+    cache_key = _make_rate_cache_key(reaction, "disequilibrium_ratio")
+    reaction_cache = _RATE_EXPRESSION_CACHE.setdefault(reaction, {})
+    if cache_key in reaction_cache:
+        return reaction_cache[cache_key]
+
     diseq_ratio = sym.Mul(
-        generate_mass_action_ratio(reaction), sym.Pow(sym.var(reaction.Keq_str), -1)
+        generate_mass_action_ratio(reaction), sym.Pow(_mk_symbol(reaction.Keq_str), -1)
     )
 
+    reaction_cache[cache_key] = diseq_ratio
     return diseq_ratio
 
 
@@ -424,28 +465,21 @@ def create_custom_rate(reaction, custom_rate, custom_parameters=None):
 
     model = reaction.model
 
-    if not isinstance(custom_rate, string_types):
+    if not isinstance(custom_rate, str):
         raise TypeError("custom_rate must be a string")
 
-    if custom_parameters:
-        if not hasattr(custom_parameters, "__iter__"):
-            custom_parameters = [custom_parameters]
-        for custom_param in custom_parameters:
-            if not isinstance(custom_param, string_types):
-                raise TypeError(
-                    "custom_parameters must be a string or " "a list of strings"
-                )
-    else:
-        custom_parameters = []
+    custom_parameters = ensure_iterable(custom_parameters or None)
+    if not all(isinstance(custom_param, str) for custom_param in custom_parameters):
+        raise TypeError("custom_parameters must be a string or a list of strings")
 
     custom_rate_expr = custom_rate.replace("(t)", "")
+    # Get the identifiers in the custom rate law once for membership checks
+    rate_identifiers = set(_IDENTIFIER_RE.findall(custom_rate_expr))
 
     # Get metabolites as symbols if they are in the custom rate law
-    obj_iter = iterkeys(reaction.metabolites) if model is None else model.metabolites
+    obj_iter = reaction.metabolites if model is None else model.metabolites
     met_syms = {
-        str(met): _mk_met_func(met)
-        for met in obj_iter
-        if re.search(str(met), custom_rate_expr)
+        str(met): _mk_met_func(met) for met in obj_iter if str(met) in rate_identifiers
     }
 
     # Get fixed concentrations as symbols if they are in the custom rate law
@@ -453,19 +487,19 @@ def create_custom_rate(reaction, custom_rate, custom_parameters=None):
     if reaction._model is not None:
         for attr in ["fixed", "boundary_metabolites"]:
             fix_syms = {
-                str(met): sym.Symbol(str(met))
+                str(met): _mk_symbol(str(met))
                 for met in getattr(reaction._model, attr)
-                if re.search("[" + str(met) + "]", custom_rate_expr)
+                if str(met) in rate_identifiers
             }
 
     # Get rate parameters as symbols if they are in the custom rate law
     rate_syms = {
-        getattr(reaction, p): sym.Symbol(getattr(reaction, p))
+        getattr(reaction, p): _mk_symbol(getattr(reaction, p))
         for p in ["kf_str", "Keq_str", "kr_str"]
-        if re.search(str(getattr(reaction, p)), custom_rate_expr)
+        if getattr(reaction, p) in rate_identifiers
     }
     # Get custom parameters as symbols
-    custom_syms = {custom: sym.Symbol(custom) for custom in custom_parameters}
+    custom_syms = {custom: _mk_symbol(custom) for custom in custom_parameters}
 
     # Create custom rate expression
     symbol_dict = {}
@@ -494,55 +528,229 @@ def generate_ode(metabolite):
     if metabolite._reaction:
         ode = sym.S.Zero
         if not metabolite.fixed:
-            for rxn in metabolite._reaction:
-                ode = sym.Add(
-                    ode, sym.Mul(rxn.get_coefficient(metabolite.id), rxn.rate)
-                )
+            # Collect the terms first to flatten the sum only once
+            ode = sym.Add(
+                *[
+                    sym.Mul(rxn._metabolites[metabolite], rxn.rate)
+                    for rxn in metabolite._reaction
+                ]
+            )
     else:
         ode = None
 
     return ode
 
 
-def _remove_metabolites_from_rate(reaction):
-    """Remove metabolites from a copy of the reaction before creating the rate.
+def generate_odes(model):
+    """Generate the ODEs for all metabolites in a model.
+
+    Each reaction rate is generated once and then distributed to the
+    metabolites of the reaction using its stoichiometry, rather than
+    generating the rates again for every metabolite of the reaction.
+
+    Parameters
+    ----------
+    model : MassModel
+        The model to generate the ODEs for.
+
+    Returns
+    -------
+    odes : dict
+        A ``dict`` where keys are the model metabolites and values are their
+        ODEs as :mod:`sympy` expressions. Metabolites not associated with any
+        reactions have ``None`` as the value.
+
+    See Also
+    --------
+    generate_ode
+
+    """
+    rates = model.rates
+    # Return the previously generated ODEs if no rate or stoichiometry changed.
+    # Only identifiers are stored since the objects refer back to the model.
+    cache_key = (
+        tuple(
+            (rxn.id, rate, tuple((met.id, c) for met, c in rxn._metabolites.items()))
+            for rxn, rate in rates.items()
+        ),
+        tuple((met.id, met.fixed, bool(met._reaction)) for met in model.metabolites),
+    )
+    cached = _ODES_CACHE.get(model)
+    if cached is not None and cached[0] == cache_key:
+        return {met: cached[1][met.id] for met in model.metabolites}
+
+    terms = {met: [] for met in model.metabolites}
+    for rxn, rate in rates.items():
+        for met, coeff in rxn._metabolites.items():
+            if met in terms:
+                terms[met].append(sym.Mul(coeff, rate))
+
+    odes = {}
+    for met, met_terms in terms.items():
+        if not met._reaction:
+            odes[met] = None
+        elif met.fixed:
+            odes[met] = sym.S.Zero
+        else:
+            odes[met] = sym.Add(*met_terms)
+
+    _ODES_CACHE[model] = (cache_key, {met.id: ode for met, ode in odes.items()})
+    return odes
+
+
+def compile_rates(model, backend="numpy"):
+    """Compile the model rates into a single numerical function.
+
+    The rates are stripped of their time dependency and converted into one
+    function through :func:`~sympy.utilities.lambdify.lambdify`, with common
+    subexpressions eliminated across all of the rates.
+
+    Parameters
+    ----------
+    model : MassModel
+        The model containing the rates to compile.
+    backend : str
+        Either ``"numpy"`` to return the :mod:`numpy` function,
+        ``"numba"`` to further compile the function using
+        :func:`numba.njit`, or ``"symengine"`` to build the function with
+        :class:`symengine.Lambdify`, which returns a :class:`numpy.ndarray`.
+        Default is ``"numpy"``.
+
+    Returns
+    -------
+    tuple (rate_function, metabolite_ids, parameter_ids)
+    rate_function : callable
+        The function ``rate_function(concentrations, parameters)`` that
+        returns the rate values in the order of the model rates.
+    metabolite_ids : list
+        The metabolite identifiers in the order expected for the values
+        of ``concentrations``.
+    parameter_ids : list
+        The parameter identifiers in the order expected for the values
+        of ``parameters``.
+
+    """
+    rates = strip_time(list(model.rates.values()))
+    metabolite_ids = [met.id for met in model.metabolites]
+    rate_function, parameter_ids = _compile_expressions(
+        tuple(rates), tuple(metabolite_ids), backend
+    )
+
+    return rate_function, metabolite_ids, list(parameter_ids)
+
+
+def compile_odes(model, backend="numpy"):
+    """Compile the model ODEs into a single numerical right-hand side function.
+
+    The ODEs of metabolites that are not fixed and are associated with
+    reactions are stripped of their time dependency and converted into one
+    function through :func:`~sympy.utilities.lambdify.lambdify`, with common
+    subexpressions eliminated across all of the ODEs. Fixed metabolites are
+    treated as parameters.
+
+    Parameters
+    ----------
+    model : MassModel
+        The model containing the ODEs to compile.
+    backend : str
+        Either ``"numpy"`` to return the :mod:`numpy` function,
+        ``"numba"`` to further compile the function using
+        :func:`numba.njit`, or ``"symengine"`` to build the function with
+        :class:`symengine.Lambdify`, which returns a :class:`numpy.ndarray`.
+        Default is ``"numpy"``.
+
+    Returns
+    -------
+    tuple (ode_function, metabolite_ids, parameter_ids)
+    ode_function : callable
+        The function ``ode_function(t, concentrations, parameters)`` that
+        returns the time derivatives in the order of ``metabolite_ids``.
+    metabolite_ids : list
+        The metabolite identifiers in the order expected for the values
+        of ``concentrations``.
+    parameter_ids : list
+        The parameter identifiers in the order expected for the values
+        of ``parameters``.
+
+    See Also
+    --------
+    compile_rates
+
+    """
+    odes = {
+        met: ode
+        for met, ode in generate_odes(model).items()
+        if ode is not None and not met.fixed
+    }
+    metabolite_ids = [met.id for met in odes]
+    ode_function, parameter_ids = _compile_expressions(
+        tuple(strip_time(list(odes.values()))),
+        tuple(metabolite_ids),
+        backend,
+        time=True,
+    )
+
+    return ode_function, metabolite_ids, list(parameter_ids)
+
+
+def _get_metabolites_for_rate(reaction):
+    """Get the reactants and products of the reaction to use in its rate.
+
+    Metabolites meeting the criteria set in the
+    :attr:`~.MassBaseConfiguration.exclude_metabolites_from_rates` are
+    filtered out without copying the reaction. Boundary reactions, and
+    reactions where all metabolites meet the criteria, are left as is.
+
+    Returns
+    -------
+    tuple
+        A ``tuple`` containing the ``list`` of reactants, the ``list`` of
+        products, and the boundary metabolite string (or ``None``) of the
+        reaction formed by the remaining metabolites.
 
     Warnings
     --------
     This method is intended for internal use only.
 
     """
-    rxn = reaction.copy()
+    reactants, products = reaction.reactants, reaction.products
+    if not MASSCONFIGURATION.exclude_metabolites_from_rates or reaction.boundary:
+        return reactants, products, reaction.boundary_metabolite
+
     # Get exclusion criteria and reaction metabolites
     exclusion_criteria_dict = MASSCONFIGURATION.exclude_metabolites_from_rates
-    metabolites_to_exclude = []
+    metabolites_to_exclude = set()
     # Iterate through attributes and exclusion values
-    for attr, exclusion_values in iteritems(exclusion_criteria_dict):
-        exclusion_values = [
-            getattr(value, attr) if hasattr(value, attr) else value
+    for attr, exclusion_values in exclusion_criteria_dict.items():
+        exclusion_values = {
+            _make_hashable(getattr(value, attr) if hasattr(value, attr) else value)
             for value in exclusion_values
-        ]
+        }
         # Iterate through reaction metabolites
-        for met in list(rxn.metabolites):
-            met_value = getattr(met, attr)
+        for met in reaction._metabolites:
+            met_value = _make_hashable(getattr(met, attr))
             # Add metabolite to be excluded if it matches the criteria
             if met_value in exclusion_values:
-                metabolites_to_exclude += [str(met)]
-
-    # Remove metabolites from reaction copy
-    rxn.subtract_metabolites(
-        {
-            met: coeff
-            for met, coeff in iteritems(rxn.metabolites)
-            if str(met) in metabolites_to_exclude
-        }
-    )
-
-    # If all metabolites were removed, leave the reaction as is
-    if not rxn.metabolites:
-        rxn = reaction.copy()
+                metabolites_to_exclude.add(met)
+
+    # If all metabolites would be removed, leave the reaction as is
+    if not metabolites_to_exclude or len(metabolites_to_exclude) == len(
+        reaction._metabolites
+    ):
+        return reactants, products, reaction.boundary_metabolite
+
+    reactants = [met for met in reactants if met not in metabolites_to_exclude]
+    products = [met for met in products if met not in metabolites_to_exclude]
+    # Treat the remaining metabolites as a boundary reaction if only one is left
+    boundary_metabolite = None
+    if len(reactants) + len(products) == 1:
+        met = (reactants + products)[0]
+        boundary_metabolite = "{0}_{1}".format(
+            met._remove_compartment_from_id_str(),
+            next(iter(MASSCONFIGURATION.boundary_compartment)),
+        )
 
-    return rxn
+    return reactants, products, boundary_metabolite
 
 
 # Internal
@@ -554,7 +762,210 @@ def _mk_met_func(met):
     This method is intended for internal use only.
 
     """
-    return dynamicsymbols(str(met))
+    return _mk_met_func_from_id(str(met))
+
+
+@lru_cache(maxsize=None)
+def _mk_met_func_from_id(met_id):
+    """Make an undefined sympy.Function of time, reusing existing functions.
+
+    Warnings
+    --------
+    This method is intended for internal use only.
+
+    """
+    return dynamicsymbols(met_id)
+
+
+@lru_cache(maxsize=None)
+def _mk_symbol(name):
+    """Make a sympy.Symbol, reusing existing symbols.
+
+    Warnings
+    --------
+    This method is intended for internal use only.
+
+    """
+    return sym.Symbol(name)
+
+
+def _generate_one_way_rate(
+    reaction, rate_type, mets, boundary_metabolite, rate_constants
+):
+    """Generate the forward or reverse rate from the given metabolites.
+
+    Warnings
+    --------
+    This method is intended for internal use only.
+
+    """
+    rate = _format_metabs_sym(
+        _make_rate_constants(reaction, rate_type, rate_constants),
+        reaction,
+        mets,
+        boundary_metabolite,
+    )
+
+    # Remove time dependency from fixed metabolites
+    rate = _set_fixed_metabolites_in_rate(reaction, rate)
+
+    # Add compartments
+    if not MASSCONFIGURATION.exclude_compartment_volumes_in_rates:
+        compartments = set(met.compartment for met in mets if met is not None)
+        rate = sym.Mul(rate, *[_mk_symbol("volume_" + c) for c in compartments])
+
+    return rate
+
+
+@lru_cache(maxsize=32)
+def _compile_expressions(expressions, variable_ids, backend, time=False):
+    """Lambdify the expressions into one function of variables and parameters.
+
+    The expressions and variable identifiers must be given as tuples so that
+    functions compiled for the same expressions are reused.
+
+    Warnings
+    --------
+    This method is intended for internal use only.
+
+    """
+    if backend not in {"numpy", "numba", "symengine"}:
+        raise ValueError("backend must be one of 'numpy', 'numba', or 'symengine'")
+    if backend == "numba" and numba is None:
+        raise ImportError("The numba package must be installed to use 'numba'")
+    if backend == "symengine" and symengine is None:
+        raise ImportError("The symengine package must be installed to use 'symengine'")
+
+    variables = [_mk_symbol(var_id) for var_id in variable_ids]
+    # All remaining symbols in the expressions are treated as parameters
+    parameters = set().union(*[expr.free_symbols for expr in expressions])
+    parameters = sorted(parameters.difference(variables), key=str)
+
+    time_args = [_mk_symbol("t")] if time else []
+    if backend == "symengine":
+        arguments = time_args + variables + parameters
+        lambdified = symengine.Lambdify(
+            [symengine.sympify(arg) for arg in arguments],
+            [symengine.sympify(expr) for expr in expressions],
+            cse=True,
+        )
+        # Lambdify takes one flat argument vector, so the position of each
+        # input in that vector is fixed here rather than on every call.
+        n_args = len(arguments)
+        stop = len(time_args) + len(variables)
+        if time:
+
+            def function(t, variable_values, parameter_values):
+                values = np.empty(n_args)
+                values[0] = t
+                values[1:stop] = variable_values
+                values[stop:] = parameter_values
+                return lambdified(values)
+
+        else:
+
+            def function(variable_values, parameter_values):
+                values = np.empty(n_args)
+                values[:stop] = variable_values
+                values[stop:] = parameter_values
+                return lambdified(values)
+
+    else:
+        function = sym.lambdify(
+            (*time_args, variables, parameters),
+            list(expressions),
+            modules="numpy",
+            cse=True,
+        )
+        if backend == "numba":
+            # Functions made by lambdify have no source file, so they cannot
+            # be compiled with numba's on-disk caching.
+            function = numba.njit(function)
+
+    return function, tuple(str(p) for p in parameters)
+
+
+def _make_rate_constants(reaction, rate_type, rate_constants):
+    """Make the product of rate constants for a rate of the given type.
+
+    Warnings
+    --------
+    This method is intended for internal use only.
+
+    """
+    if rate_type not in {1, 2, 3}:
+        raise ValueError("rate_type must be 1, 2, or 3")
+
+    return sym.Mul(
+        *[
+            sym.Pow(_mk_symbol(getattr(reaction, attr)), exponent)
+            for attr, exponent in rate_constants[rate_type]
+        ]
+    )
+
+
+def _make_hashable(value):
+    """Make a hashable key from a metabolite attribute value.
+
+    Dictionaries (e.g. the metabolite elements) are turned into a
+    ``frozenset`` of their items so that they can be compared by hash.
+
+    Warnings
+    --------
+    This method is intended for internal use only.
+
+    """
+    if isinstance(value, dict):
+        return frozenset(value.items())
+    return value
+
+
+def _make_rate_cache_key(reaction, rate_type):
+    """Make a key from the reaction attributes that determine its rate or ratios.
+
+    Warnings
+    --------
+    This method is intended for internal use only.
+
+    """
+    exclusion_criteria_dict = MASSCONFIGURATION.exclude_metabolites_from_rates
+    if reaction.model is not None:
+        boundary_conditions = reaction.model.boundary_conditions
+    else:
+        boundary_conditions = {}
+
+    metabolites = tuple(
+        (
+            met.id,
+            coeff,
+            met.compartment,
+            met.fixed
+            or not isinstance(boundary_conditions.get(met.id, sym.S.Zero), sym.Basic),
+            tuple(str(getattr(met, attr, None)) for attr in exclusion_criteria_dict),
+        )
+        for met, coeff in reaction._metabolites.items()
+    )
+
+    return (
+        rate_type,
+        reaction.id,
+        reaction.reversible,
+        metabolites,
+        str(exclusion_criteria_dict),
+        MASSCONFIGURATION.exclude_compartment_volumes_in_rates,
+        next(iter(MASSCONFIGURATION.boundary_compartment)),
+    )
+
+
+def _clear_rate_expression_cache(reaction):
+    """Remove the stored rate expressions for the reaction.
+
+    Warnings
+    --------
+    This method is intended for internal use only.
+
+    """
+    _RATE_EXPRESSION_CACHE.pop(reaction, None)
 
 
 def _set_fixed_metabolites_in_rate(reaction, rate):
@@ -566,40 +977,49 @@ def _set_fixed_metabolites_in_rate(reaction, rate):
 
     """
     to_strip = [
-        str(metabolite) for metabolite in list(reaction.metabolites) if metabolite.fixed
+        str(metabolite) for metabolite in reaction._metabolites if metabolite.fixed
     ]
 
     if reaction.model is not None and reaction.model.boundary_conditions:
         to_strip += [
             met
-            for met, value in iteritems(reaction.model.boundary_conditions)
+            for met, value in reaction.model.boundary_conditions.items()
             if not isinstance(value, sym.Basic)
         ]
     if to_strip:
-        to_sub = {
-            _mk_met_func(met): sym.Symbol(met)
-            for met in to_strip
-            if _mk_met_func(met) in list(rate.atoms(sym.Function))
-        }
-        rate = rate.subs(to_sub)
+        # Walk the rate once for its functions and replace them in one pass
+        rate_functions = rate.atoms(sym.Function)
+        to_sub = {}
+        for met in to_strip:
+            met_func = _mk_met_func(met)
+            if met_func in rate_functions:
+                to_sub[met_func] = _mk_symbol(met)
+        rate = rate.xreplace(to_sub)
 
     return rate
 
 
-def _format_metabs_sym(expr, rxn, mets):
+def _format_metabs_sym(expr, rxn, mets, boundary_metabolite):
     """Format the metabolites for a rate law or ratio sympy expression."""
     # For boundary reactions, generate an "boundary" metabolite for boundary
-    if rxn.boundary and not mets:
-        expr = sym.Mul(expr, sym.Symbol(rxn.boundary_metabolite))
+    if boundary_metabolite is not None and not mets:
+        expr = sym.Mul(expr, _mk_symbol(boundary_metabolite))
+    # For a single metabolite with a unit coefficient, the most common case
+    elif len(mets) == 1 and abs(rxn._metabolites[mets[0]]) == 1:
+        expr = sym.Mul(expr, _mk_met_func(mets[0]))
     # For all other reactions
     else:
+        # Collect the factors first to flatten the product only once
+        factors = [expr]
+        coefficients = rxn._metabolites
         for met in mets:
             met_ode = _mk_met_func(met)
-            coeff = abs(rxn.get_coefficient(met.id))
+            coeff = abs(coefficients[met])
             if coeff == 1:
-                expr = sym.Mul(expr, met_ode)
+                factors.append(met_ode)
             else:
-                expr = sym.Mul(expr, sym.Pow(met_ode, coeff))
+                factors.append(sym.Pow(met_ode, coeff))
+        expr = sym.Mul(*factors)
     return expr
 
 
@@ -612,19 +1032,16 @@ def _apply_func_to_expressions(sympy_expr, function, args=None):
 
     """
     if args is None:
-
-        def func(expr):
-            return function(expr)
-
+        func = function
     else:
 
         def func(expr):
             return function(expr, *args)
 
     if isinstance(sympy_expr, dict):
-        new_expr = dict((k, func(expr)) for k, expr in iteritems(sympy_expr))
+        new_expr = {k: func(expr) for k, expr in sympy_expr.items()}
     elif hasattr(sympy_expr, "__iter__"):
-        new_expr = list(func(expr) for expr in sympy_expr)
+        new_expr = [func(expr) for expr in sympy_expr]
     else:
         new_expr = func(sympy_expr)
 
@@ -642,4 +1059,7 @@ __all__ = (
     "generate_disequilibrium_ratio",
     "create_custom_rate",
     "generate_ode",
+    "generate_odes",
+    "compile_rates",
+    "compile_odes",
 )
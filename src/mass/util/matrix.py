@@ -9,6 +9,7 @@ return type of the output. Valid matrix types include:
 * ``'dense'`` for a :class:`numpy.ndarray`
 * ``'dok'`` for a :class:`scipy.sparse.dok_matrix`
 * ``'lil'`` for a :class:`scipy.sparse.lil_matrix`
+* ``'csr'`` for a :class:`scipy.sparse.csr_matrix`
 * ``'DataFrame'`` for a :class:`pandas.DataFrame`
 * ``'symbolic'`` for a
   :class:`sympy.MutableDenseMatrix <sympy.matrices.dense.MutableDenseMatrix>`
@@ -31,14 +32,20 @@ import numpy as np
 import pandas as pd
 import sympy as sym
 from scipy import linalg
-from scipy.sparse import dok_matrix, lil_matrix
+from scipy.sparse import coo_matrix, csr_matrix, dok_matrix, issparse, lil_matrix
 from six import iteritems
 
 from mass.core.mass_configuration import MassConfiguration
 from mass.util.expressions import _mk_met_func
 
 
-_ARRAY_TYPES = ["dense", "dok", "lil", "DataFrame", "symbolic"]
+_ARRAY_TYPES = ["dense", "dok", "lil", "csr", "DataFrame", "symbolic"]
+
+_MATRIX_CONSTRUCTORS = dict(
+    zip(
+        _ARRAY_TYPES, [np.zeros, dok_matrix, lil_matrix, csr_matrix, np.zeros, np.zeros]
+    )
+)
 
 MASSCONFIGURATION = MassConfiguration()
 
@@ -78,16 +85,18 @@ def gradient(
     rates = model.rates
 
     # Construct the base gradient matrix
-    gradient_mat = sym.Matrix(np.zeros((len(rates), len(model.metabolites))))
+    gradient_mat = sym.zeros(len(rates), len(model.metabolites))
 
-    # Get index for metabolites and reactions
-    r_ind = model.reactions.index
-    m_ind = model.metabolites.index
+    # Get index for metabolites and reactions once for the loop
+    r_ind = {rxn: i for i, rxn in enumerate(model.reactions)}
+    m_ind = {_mk_met_func(met): i for i, met in enumerate(model.metabolites)}
 
-    # Create the gradient matrix
+    # Create the gradient matrix, differentiating each rate only with respect
+    # to the metabolites it depends on since all other entries are zero.
     for rxn, rate in iteritems(rates):
-        for met in model.metabolites:
-            gradient_mat[r_ind(rxn), m_ind(met)] = rate.diff(_mk_met_func(met))
+        for met_func in rate.atoms(sym.Function):
+            if met_func in m_ind:
+                gradient_mat[r_ind[rxn], m_ind[met_func]] = rate.diff(met_func)
 
     # Get values for substitution
     if use_concentration_values or use_parameter_values:
@@ -155,12 +164,16 @@ def kappa(
 
     """
     gradient_matrix = gradient(
-        model, use_parameter_values, use_concentration_values, array_type
-    )
-    kappa_matrix = sym.diag(
-        *[gradient_matrix[row, :].norm() for row in range(gradient_matrix.rows)]
+        model, use_parameter_values, use_concentration_values, "symbolic"
     )
-    kappa_matrix = kappa_matrix.subs({sym.nan: sym.S.Zero})
+    if gradient_matrix.is_symbolic():
+        kappa_matrix = sym.diag(
+            *[gradient_matrix[row, :].norm() for row in range(gradient_matrix.rows)]
+        )
+        kappa_matrix = kappa_matrix.subs({sym.nan: sym.S.Zero})
+    else:
+        # Compute the row norms of a numerical matrix in one vectorized call
+        kappa_matrix = np.diag(np.linalg.norm(_to_dense_float(gradient_matrix), axis=1))
     kappa_matrix = convert_matrix(
         kappa_matrix,
         array_type=array_type,
@@ -206,12 +219,24 @@ def gamma(
 
     """
     gradient_matrix = gradient(
-        model, use_parameter_values, use_concentration_values, array_type
-    )
-    gamma_matrix = sym.Matrix(
-        [gradient_matrix[row, :].normalized() for row in range(gradient_matrix.rows)]
+        model, use_parameter_values, use_concentration_values, "symbolic"
     )
-    gamma_matrix = gamma_matrix.subs({sym.nan: sym.S.Zero})
+    if gradient_matrix.is_symbolic():
+        gamma_matrix = sym.Matrix(
+            [
+                gradient_matrix[row, :].normalized()
+                for row in range(gradient_matrix.rows)
+            ]
+        )
+        gamma_matrix = gamma_matrix.subs({sym.nan: sym.S.Zero})
+    else:
+        # Normalize the rows of a numerical matrix in one vectorized call,
+        # leaving rows without a nonzero entry as zeros.
+        gamma_matrix = _to_dense_float(gradient_matrix)
+        norms = np.linalg.norm(gamma_matrix, axis=1, keepdims=True)
+        gamma_matrix = np.divide(
+            gamma_matrix, norms, out=np.zeros_like(gamma_matrix), where=norms != 0
+        )
     gamma_matrix = convert_matrix(
         gamma_matrix,
         array_type=array_type,
@@ -339,10 +364,11 @@ def nullspace(matrix, atol=1e-13, rtol=0, decimal_precision=False):
     ns = vh[nnz:].conj().T
 
     # Apply zero singular value tolerance
+    round_function = MASSCONFIGURATION.round_function if decimal_precision else None
     for i, row in enumerate(ns):
         for j, val in enumerate(row):
-            if decimal_precision and MASSCONFIGURATION.decimal_precision is not None:
-                val = round(val, MASSCONFIGURATION.decimal_precision)
+            if round_function is not None:
+                val = round_function(val)
             if abs(val) <= tol:
                 ns[i, j] = 0.0
     return ns
@@ -446,10 +472,11 @@ def columnspace(matrix, atol=1e-13, rtol=0, decimal_precision=False):
     tol = max(atol, rtol * s[0])
 
     # Apply zero singular value tolerance
+    round_function = MASSCONFIGURATION.round_function if decimal_precision else None
     for i, row in enumerate(cs):
         for j, val in enumerate(row):
-            if decimal_precision and MASSCONFIGURATION.decimal_precision is not None:
-                val = round(val, MASSCONFIGURATION.decimal_precision)
+            if round_function is not None:
+                val = round_function(val)
             if abs(val) <= tol:
                 cs[i, j] = 0.0
 
@@ -631,8 +658,8 @@ def convert_matrix(matrix, array_type, dtype, row_ids=None, col_ids=None):
     array_type : str
         A string identifiying the desired format for the returned matrix.
         Valid matrix types include ``'dense'``, ``'dok'``, ``'lil'``,
-        ``'DataFrame'``, and ``'symbolic'`` See the :mod:`~.matrix` module
-        documentation for more information on the ``array_type``.
+        ``'csr'``, ``'DataFrame'``, and ``'symbolic'`` See the :mod:`~.matrix`
+        module documentation for more information on the ``array_type``.
     dtype : data-type
         The desired array data-type for the matrix.
     row_ids : array-like
@@ -650,21 +677,26 @@ def convert_matrix(matrix, array_type, dtype, row_ids=None, col_ids=None):
     if array_type not in _ARRAY_TYPES:
         raise ValueError("Unrecognized array_type.")
 
-    # Convert the matrix type
-    conversion_method_dict = dict(
-        zip(_ARRAY_TYPES, [_to_dense, _to_dok, _to_lil, _to_dense, _to_dense])
-    )
+    # Avoid converting a sympy matrix to an array and back again
+    if array_type == "symbolic" and isinstance(matrix, sym.MutableDenseMatrix):
+        return matrix
 
+    # Convert the matrix type
     try:
-        matrix = conversion_method_dict[array_type](matrix)
+        matrix = _CONVERSION_METHODS[array_type](matrix)
         # Convert the dtype
         if array_type != "symbolic":
-            if array_type == "DataFrame":
-                matrix = pd.DataFrame(matrix, index=row_ids, columns=col_ids)
+            # Cast the values before any DataFrame wrapping, copying only if
+            # the data-type changes.
             try:
-                matrix = matrix.astype(dtype)
+                matrix = matrix.astype(dtype, copy=False)
             except TypeError:
                 warnings.warn("Could not cast matrix as the given dtype")
+            if array_type == "DataFrame":
+                # Wrap the array as the DataFrame's block without copying it
+                matrix = pd.DataFrame(
+                    matrix, index=row_ids, columns=col_ids, copy=False
+                )
         else:
             matrix = sym.Matrix(matrix)
     except TypeError:
@@ -683,11 +715,11 @@ def _ensure_dense_matrix(matrix):
     """
     if isinstance(matrix, (np.ndarray, pd.DataFrame)):
         pass
-    elif isinstance(matrix, (dok_matrix, lil_matrix)):
+    elif issparse(matrix):
         matrix = matrix.toarray()
     elif isinstance(matrix, sym.Matrix):
         try:
-            matrix = np.array(matrix).astype(np.float64)
+            matrix = _to_dense_float(matrix)
         except TypeError:
             raise ValueError(
                 "Cannot have sympy symbols in the matrix. Try "
@@ -696,8 +728,8 @@ def _ensure_dense_matrix(matrix):
     else:
         raise TypeError(
             "Matrix must be one of the following formats: "
-            "numpy.ndarray, scipy.dok_matrix, scipy.lil_matrix, "
-            "pandas.DataFrame, or sympy.Matrix."
+            "numpy.ndarray, a scipy sparse matrix, pandas.DataFrame, "
+            "or sympy.Matrix."
         )
     return matrix
 
@@ -709,7 +741,7 @@ def _get_matrix_constructor(
 
     Parameters
     ----------
-    array_type: {'dense', 'dok', 'lil', 'DataFrame', 'symbolic'}, optional
+    array_type: {'dense', 'dok', 'lil', 'csr', 'DataFrame', 'symbolic'}, optional
         The desired type after for the matrix. If None, defaults to "dense".
     dtype: data-type, optional
         The desired array data-type for the stoichiometric matrix. If None,
@@ -738,11 +770,7 @@ def _get_matrix_constructor(
     if dtype is None:
         dtype = dtype_default
 
-    # Dictionary of options for constructing the matrix
-    matrix_constructor = dict(
-        zip(_ARRAY_TYPES, [np.zeros, dok_matrix, lil_matrix, np.zeros, np.zeros])
-    )
-    constructor = matrix_constructor[array_type]
+    constructor = _MATRIX_CONSTRUCTORS[array_type]
     return (constructor, array_type, dtype)
 
 
@@ -752,7 +780,7 @@ def _to_dense(matrix):
     if isinstance(matrix, np.ndarray):
         pass
     elif isinstance(matrix, pd.DataFrame):
-        matrix = matrix.as_matrix()
+        matrix = matrix.to_numpy()
     elif isinstance(matrix, sym.Matrix):
         matrix = np.array(matrix)
     else:
@@ -761,20 +789,55 @@ def _to_dense(matrix):
     return matrix
 
 
+def _to_dense_float(matrix):
+    """Convert a numerical sympy matrix to a float numpy array in one pass."""
+    return sym.matrix2numpy(matrix, dtype=np.float64)
+
+
+def _sym_to_sparse(matrix, sparse_format):
+    """Convert a numerical sympy matrix to a sparse matrix from its nonzeros."""
+    nonzeros = matrix.todok()
+    data = np.fromiter(
+        (float(value) for value in nonzeros.values()),
+        dtype=np.float64,
+        count=len(nonzeros),
+    )
+    rows = [i for i, j in nonzeros]
+    cols = [j for i, j in nonzeros]
+    return coo_matrix((data, (rows, cols)), shape=matrix.shape).asformat(sparse_format)
+
+
 def _to_lil(matrix):
     """Convert matrix to a scipy lil matrix."""
     if isinstance(matrix, sym.Matrix):
-        matrix = sym.matrix2numpy(matrix, dtype=float)
+        return _sym_to_sparse(matrix, "lil")
+    if issparse(matrix):
+        return matrix.asformat("lil")
     return lil_matrix(matrix)
 
 
 def _to_dok(matrix):
     """Convert matrix to a scipy dok matrix."""
     if isinstance(matrix, sym.Matrix):
-        matrix = sym.matrix2numpy(matrix, dtype=float)
+        return _sym_to_sparse(matrix, "dok")
+    if issparse(matrix):
+        return matrix.asformat("dok")
     return dok_matrix(matrix)
 
 
+def _to_csr(matrix):
+    """Convert matrix to a scipy csr matrix."""
+    if isinstance(matrix, sym.Matrix):
+        return _sym_to_sparse(matrix, "csr")
+    if issparse(matrix):
+        return matrix.asformat("csr")
+    return csr_matrix(matrix)
+
+
+_CONVERSION_METHODS = dict(
+    zip(_ARRAY_TYPES, [_to_dense, _to_dok, _to_lil, _to_csr, _to_dense, _to_dense])
+)
+
 __all__ = (
     "columnspace",
     "eig",
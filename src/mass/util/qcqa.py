@@ -8,7 +8,6 @@ from six import iteritems, itervalues, string_types
 from tabulate import tabulate
 
 from mass.core.mass_configuration import MassConfiguration
-from mass.util.expressions import _mk_met_func
 from mass.util.util import _check_kwargs, ensure_iterable
 
 
@@ -207,7 +206,7 @@ def get_missing_custom_parameters(model, reaction_list=None, simulation_only=Tru
         rate = model.custom_rates[rxn]
         symbols = [
             str(symbol)
-            for symbol in list(rate.atoms(sym.Symbol))
+            for symbol in rate.free_symbols
             if str(symbol) not in model.metabolites
         ]
         customs = []
@@ -415,11 +414,14 @@ def check_elemental_consistency(model, reaction_list=None):
 
     inconsistent = {}
     for reaction in reaction_list:
-        if not reaction.boundary and reaction.check_mass_balance():
-            unbalanced = ""
-            for elem, amount in iteritems(reaction.check_mass_balance()):
-                unbalanced += "{0}: {1:.1f}; ".format(elem, amount)
-            inconsistent[reaction] = unbalanced.rstrip("; ")
+        if reaction.boundary:
+            continue
+        mass_balance = reaction.check_mass_balance()
+        if mass_balance:
+            inconsistent[reaction] = "; ".join(
+                "{0}: {1:.1f}".format(elem, amount)
+                for elem, amount in iteritems(mass_balance)
+            )
 
     return inconsistent
 
@@ -743,7 +745,7 @@ def _check_custom_for_standard(model, reaction):
     """
     customs = {}
     if reaction in model.custom_rates and model.custom_rates[reaction] is not None:
-        symbols = list(model.custom_rates[reaction].atoms(sym.Symbol))
+        symbols = model.custom_rates[reaction].free_symbols
         symbols = sorted(
             [
                 str(s)
@@ -751,16 +753,10 @@ def _check_custom_for_standard(model, reaction):
                 if str(s) in [reaction.Keq_str, reaction.kf_str, reaction.kr_str]
             ]
         )
-        for param in symbols:
-            try:
-                reaction.parameters[param]
-            except KeyError:
-                if reaction not in customs:
-                    customs[reaction] = "{0}; ".format(param.split("_")[0])
-                else:
-                    customs[reaction] += "{0}; ".format(param.split("_")[0])
-        if reaction in customs:
-            customs[reaction] = customs[reaction].rstrip("; ")
+        parameters = reaction.parameters
+        missing = [param.split("_")[0] for param in symbols if param not in parameters]
+        if missing:
+            customs[reaction] = "; ".join(missing)
     return customs
 
 
@@ -788,14 +784,14 @@ def _check_if_conc_needed(model, missing):
     """
     needed = set()
     for rate in itervalues(model.rates):
-        needed.update(rate.atoms(sym.Function))
-        needed.update(rate.atoms(sym.Symbol))
+        needed.update(rate.atoms(sym.Symbol, sym.Function))
+    # Index the needed symbols and functions of time by their names
+    needed = {
+        atom.name if isinstance(atom, sym.Symbol) else atom.func.__name__
+        for atom in needed
+    }
 
-    missing = [
-        met
-        for met in missing
-        if sym.Symbol(str(met)) in needed or _mk_met_func(str(met)) in needed
-    ]
+    missing = [met for met in missing if str(met) in needed]
 
     return missing
 
@@ -810,7 +806,7 @@ def _check_if_param_needed(model, missing, customs=False):
     """
     needed = set()
     for rate in itervalues(model.rates):
-        needed.update(rate.atoms(sym.Symbol))
+        needed.update(rate.free_symbols)
 
     for reaction, missing_values_str in iteritems(missing.copy()):
         missing_params = missing_values_str.split("; ")
@@ -21,6 +21,8 @@ LOG_COLORS = {
 }
 """dict: Contains logger levels and corresponding color codes."""
 
+_KWARG_TYPES = {float: (float, integer_types), list: (list, np.ndarray)}
+
 
 # Public
 def show_versions():
@@ -39,7 +41,10 @@ def ensure_iterable(item):
     """
     # Make list iterable if necessary
     if item is None:
-        item = list()
+        return []
+    # Lists are still copied since callers may store or alter the result.
+    if type(item) is list:
+        return item[:]
     if not hasattr(item, "__iter__") or isinstance(item, string_types):
         item = [item]
 
@@ -143,11 +148,7 @@ def _check_kwargs(default_kwargs, kwargs):
                 # Check the value type against the default.
                 if value is None:
                     continue
-                type_ = type(value)
-                if type_ == float:
-                    type_ = (float, integer_types)
-                if type_ == list:
-                    type_ = (list, np.ndarray)
+                type_ = _KWARG_TYPES.get(type(value), type(value))
                 if not isinstance(kwargs[key], type_):
                     raise TypeError(
                         "'{0}' must be of type: {1}.".format(key, str(type_))
@@ -178,6 +179,22 @@ def _mk_new_dictlist(ref_dictlist, old_dictlist, ensure_unique=False):
     return DictList(items)
 
 
+def _bulk_undo(operations):
+    """Apply a batch of ``(function, argument)`` undo operations in reverse.
+
+    Allows a single callback to be registered with a context in place of one
+    ``partial`` per modified item. The operations are applied last to first,
+    the same order the context would undo separately registered callbacks.
+
+    Warnings
+    --------
+    This method is intended for internal use only.
+
+    """
+    for function, argument in reversed(operations):
+        function(argument)
+
+
 class ColorFormatter(logging.Formatter):
     """Colored Formatter for logging output.
 
@@ -170,7 +170,7 @@ of the :mod:`~mass.visualiation` module.
       For :func:`~.plot_tiled_phase_portraits`, the colors will be applied to
       all tiles containing phase portrait plots.
 
-      Default is ``None``. Ignored if the kwarg ``prop_cycler`` is also
+      Default is ``None``. Ignored if the kwarg ``prop_cycle`` is also
       provided.
   linestyle :
       Value or ``iterable`` of values representing valid :mod:`matplotlib`
@@ -181,12 +181,12 @@ of the :mod:`~mass.visualiation` module.
       to all tiles containing phase portrait plots.
 
       Default is ``None`` to use default value in :mod:`matplotlib.rcsetup`.
-      Ignored if the kwarg ``prop_cycler`` is also provided.
+      Ignored if the kwarg ``prop_cycle`` is also provided.
   linewidth :
       ``float`` value representing the linewidth (in points) to set.
 
       Default is ``None`` to use default value in :mod:`matplotlib.rcsetup`.
-      Ignored if the kwarg ``prop_cycler`` is also provided.
+      Ignored if the kwarg ``prop_cycle`` is also provided.
   marker :
       Value or ``iterable`` of values representing valud :mod:`matplotlib`
       marker_ values to use as line markers. If a single marker is provided,
@@ -198,15 +198,15 @@ of the :mod:`~mass.visualiation` module.
 
       For functions in :mod:`.comparision`, default is ``"o"``, otherwise
       default is ``None`` to use default value in :mod:`matplotlib.rcsetup`.
-      Ignored if the kwarg ``prop_cycler`` is also provided.
+      Ignored if the kwarg ``prop_cycle`` is also provided.
   markersize :
       ``float`` value representing the size of the marker (in points) to set.
       For :func:`~.plot_tiled_phase_portraits`, the markersizes will be applied
       to all tiles containing phase portrait plots. Ignored if the kwarg
-      ``prop_cycler`` is also provided.
+      ``prop_cycle`` is also provided.
 
       Default is ``None`` to use default value in :mod:`matplotlib.rcsetup`.
-      Ignored if the kwarg ``prop_cycler`` is also provided.
+      Ignored if the kwarg ``prop_cycle`` is also provided.
   grid :
       Either a ``bool`` or a ``tuple`` of form ``(which, axis)`` where the
       values for ``which`` and ``axis`` are one of the following:
@@ -13,6 +13,9 @@ simulation of models.
     * :func:`~.phase_portraits.plot_tiled_phase_portrait`
 
 """
+from functools import lru_cache
+from operator import gt, lt, ne
+from types import MappingProxyType
 from warnings import warn
 
 import numpy as np
@@ -22,6 +25,9 @@ from mass.util.util import _check_kwargs
 from mass.visualization import visualization_util as v_util
 
 
+_PLOT_TILE_PLACEMENT_TESTS = {"all": ne, "lower": lt, "upper": gt}
+
+
 def plot_phase_portrait(mass_solution, x, y, ax=None, legend=None, **kwargs):
     """Plot phase portraits of solutions in a given :class:`~.MassSolution`.
 
@@ -105,9 +111,7 @@ def plot_phase_portrait(mass_solution, x, y, ax=None, legend=None, **kwargs):
     # Validate whether necessary packages are installed.
     v_util._validate_visualization_packages("matplotlib")
     # Check kwargs
-    kwargs = _check_kwargs(
-        get_phase_portrait_default_kwargs("plot_phase_portrait"), kwargs
-    )
+    kwargs = _check_kwargs(_make_default_kwargs("plot_phase_portrait"), kwargs)
     # Get the axies instance
     ax = v_util._validate_axes_instance(ax)
 
@@ -266,9 +270,7 @@ def plot_ensemble_phase_portrait(
     # Validate whether necessary packages are installed.
     v_util._validate_visualization_packages("matplotlib")
     # Check kwargs
-    kwargs = _check_kwargs(
-        get_phase_portrait_default_kwargs("plot_ensemble_phase_portrait"), kwargs
-    )
+    kwargs = _check_kwargs(_make_default_kwargs("plot_ensemble_phase_portrait"), kwargs)
     # Get the axes instance
     ax = v_util._validate_axes_instance(ax)
 
@@ -447,9 +449,7 @@ def plot_tiled_phase_portraits(
     # Validate whether necessary packages are installed.
     v_util._validate_visualization_packages("matplotlib")
     # Check kwargs
-    kwargs = _check_kwargs(
-        get_phase_portrait_default_kwargs("plot_tiled_phase_portraits"), kwargs
-    )
+    kwargs = _check_kwargs(_make_default_kwargs("plot_tiled_phase_portraits"), kwargs)
     # Get the axes instance
     ax = v_util._validate_axes_instance(ax)
 
@@ -460,10 +460,11 @@ def plot_tiled_phase_portraits(
 
     # Get the solutions to be observed and validate time vector.
     observable = v_util._validate_plot_observables(mass_solution, observable, **kwargs)
-    if ax.child_axes is not None and len(ax.child_axes) == len(observable) ** 2:
-        subaxes = np.reshape(
-            np.array(ax.child_axes), (len(observable), len(observable))
-        )
+    # Get the observable keys once for the N x N tiles
+    observable_keys = list(observable)
+    n_obs = len(observable_keys)
+    if ax.child_axes is not None and len(ax.child_axes) == n_obs**2:
+        subaxes = np.reshape(np.array(ax.child_axes), (n_obs, n_obs))
     else:
         subaxes = None
     plot_tile_placement = v_util._validate_tile_placement(
@@ -476,13 +477,13 @@ def plot_tiled_phase_portraits(
     ax.axis("off")
     # Create N x N subplots where N is the number of observable solutions
     # Fraction of larger figure to be utilized by the subplot (Inverse of N)
-    sub_ax_placement_vals = [1 / len(observable)] * 2
+    sub_ax_placement_vals = [1 / n_obs] * 2
     # Get width and height. Alter if ticks will be included
     if tile_kwargs.get("tile_ticks_on"):
         sub_ax_placement_vals[1] = sub_ax_placement_vals[1] * 0.75
 
-    for j, y in enumerate(observable):
-        for i, x in enumerate(observable):
+    for j, y in enumerate(observable_keys):
+        for i, x in enumerate(observable_keys):
             # [x0, y0, width, height] from lower left corner of inset axes
             if subaxes is not None:
                 sub_ax = subaxes[j, i]
@@ -513,7 +514,7 @@ def plot_tiled_phase_portraits(
                 sub_ax.set_xticks([])
                 sub_ax.set_yticks([])
             # Set xlabels only on the final row
-            if j == len(observable) - 1:
+            if j == n_obs - 1:
                 sub_ax.set_xlabel(x, kwargs.get("tile_xlabel_fontdict"))
             # Set ylabels only on the first column
             if i == 0:
@@ -562,6 +563,18 @@ def get_phase_portrait_default_kwargs(function_name):
             + str(__all__[:-1])
         )
 
+    return dict(_make_default_kwargs(function_name))
+
+
+@lru_cache(maxsize=None)
+def _make_default_kwargs(function_name):
+    """Make the read-only default ``kwargs`` once for each plotting function.
+
+    Warnings
+    --------
+    This method is intended for internal use only.
+
+    """
     default_kwargs = {
         "time_vector": None,
         "plot_function": "plot",
@@ -624,7 +637,7 @@ def get_phase_portrait_default_kwargs(function_name):
             }
         )
 
-    return default_kwargs
+    return MappingProxyType(default_kwargs)
 
 
 def _sep_kwargs_for_tiled_phase_portraits(**kwargs):
@@ -680,15 +693,9 @@ def _create_tiled_phase_portraits_tile(ax, observable, *args):
     This method is intended for internal use only.
 
     """
-
-    def get_plot_tile_bool(i, j, plot_tile_placement):
-        """Get a bool indicating if a plot should be made."""
-        return {"all": i < j or i > j, "lower": i < j, "upper": i > j}.get(
-            plot_tile_placement
-        )
-
     i, j, x, y, plot_tile_placement, data_matrix, tile_kwargs, pp_kwargs = args
-    plot_tile_bool = get_plot_tile_bool(i, j, plot_tile_placement)
+    # Get a bool indicating if a plot should be made.
+    plot_tile_bool = _PLOT_TILE_PLACEMENT_TESTS[plot_tile_placement](i, j)
 
     # Validate fontsize and set default data tile fontsize as large if needed.
     if not tile_kwargs.get("data_tile_fontsize"):
@@ -12,6 +12,8 @@ simulation of models.
     * :func:`~.time_profiles.plot_ensemble_time_profile`
 
 """
+from functools import lru_cache
+from types import MappingProxyType
 from warnings import warn
 
 from six import iteritems
@@ -101,7 +103,7 @@ def plot_time_profile(mass_solution, observable=None, ax=None, legend=None, **kw
     # Validate whether necessary packages are installed.
     v_util._validate_visualization_packages("matplotlib")
     # Check kwargs
-    kwargs = _check_kwargs(get_time_profile_default_kwargs("plot_time_profile"), kwargs)
+    kwargs = _check_kwargs(_make_default_kwargs("plot_time_profile"), kwargs)
     # Get the axies instance
     ax = v_util._validate_axes_instance(ax)
 
@@ -267,9 +269,7 @@ def plot_ensemble_time_profile(
     # Validate whether necessary packages are installed.
     v_util._validate_visualization_packages("matplotlib")
     # Check kwargs
-    kwargs = _check_kwargs(
-        get_time_profile_default_kwargs("plot_ensemble_time_profile"), kwargs
-    )
+    kwargs = _check_kwargs(_make_default_kwargs("plot_ensemble_time_profile"), kwargs)
     # Get the axes instance and validate the interval type
     ax = v_util._validate_axes_instance(ax)
     interval_type = v_util._validate_interval_type(interval_type)
@@ -427,6 +427,18 @@ def get_time_profile_default_kwargs(function_name):
             + str(__all__[:-1])
         )
 
+    return dict(_make_default_kwargs(function_name))
+
+
+@lru_cache(maxsize=None)
+def _make_default_kwargs(function_name):
+    """Make the read-only default ``kwargs`` once for each plotting function.
+
+    Warnings
+    --------
+    This method is intended for internal use only.
+
+    """
     default_kwargs = {
         "time_vector": None,
         "plot_function": "plot",
@@ -471,7 +483,7 @@ def get_time_profile_default_kwargs(function_name):
             }
         )
 
-    return default_kwargs
+    return MappingProxyType(default_kwargs)
 
 
 __all__ = (
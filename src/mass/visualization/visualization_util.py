@@ -7,6 +7,7 @@ The functions found in this module are NOT intended for direct use.
 
 """
 from collections.abc import Iterable
+from functools import lru_cache
 from warnings import warn
 
 
@@ -63,6 +64,9 @@ OUTSIDE_LEGEND_LOCATION_AND_ANCHORS = {
 }
 """dict: Legend location and anchors for default outside legend locations."""
 
+PLOTTING_FUNCTIONS = frozenset({"plot", "semilogx", "semilogy", "loglog"})
+"""frozenset: Names of the :class:`~matplotlib.axes.Axes` plotting methods."""
+
 
 def _validate_visualization_packages(package):
     """Validate whether a visualization package has been installed.
@@ -125,7 +129,10 @@ def _validate_time_vector(time_vector, default_time_vector):
     """
     # Ensure time_vector is valid
     if time_vector is None:
-        return np.array(sorted(default_time_vector))
+        time_vector = default_time_vector
+    # Sort arrays with numpy rather than element by element in Python
+    if isinstance(time_vector, np.ndarray):
+        return np.sort(time_vector)
     if isinstance(time_vector, Iterable) and not isinstance(time_vector, string_types):
         return np.array(sorted(time_vector))
 
@@ -152,7 +159,7 @@ def _validate_plot_observables(mass_solution, observable, **kwargs):
     observable = [getattr(x, "id", x) for x in observable]
 
     # Check to ensure specified observables are in the MassSolution
-    if not set(observable).issubset(set(iterkeys(mass_solution))):
+    if not all(x in mass_solution for x in observable):
         raise ValueError("`observable` must keys from the mass_solution.")
 
     # Turn solutions into interpolating functions if the timepoints provided
@@ -211,11 +218,7 @@ def _validate_ensemble_plot_observables(mass_solution_list, observable, **kwargs
 
     # Raise error if solutions are missing observables
     missing_observables = [
-        mass_solution_list[idx]
-        for idx, x in enumerate(
-            [set(observable).issubset(set(iterkeys(sol))) for sol in mass_solution_list]
-        )
-        if not x
+        sol for sol in mass_solution_list if not all(x in sol for x in observable)
     ]
     if missing_observables:
         raise ValueError(
@@ -247,14 +250,17 @@ def _validate_ensemble_plot_observables(mass_solution_list, observable, **kwargs
         if kwargs.get("deviation"):
             sol = _calculate_deviation_solutions(sol, **kwargs)
 
-    # Make DataFrames for each observable solution with timepoints as columns
-    observable_dataframes = {
-        sol_key: pd.DataFrame(
-            data=[sol[sol_key] for sol in mass_solution_list if sol_key in sol],
-            columns=time_vector,
+    # Make DataFrames for each observable solution with timepoints as columns,
+    # filling a preallocated array rather than stacking a list of solutions.
+    observable_dataframes = {}
+    for sol_key in observable:
+        sols = [sol for sol in mass_solution_list if sol_key in sol]
+        data = np.empty((len(sols), len(time_vector)))
+        for i, sol in enumerate(sols):
+            data[i] = sol[sol_key]
+        observable_dataframes[sol_key] = pd.DataFrame(
+            data=data, columns=time_vector, copy=False
         )
-        for sol_key in observable
-    }
 
     return observable_dataframes, time_vector
 
@@ -293,7 +299,7 @@ def _calculate_confidence_interval(ci_value, sol_df, CI_distribution):
         CI_distribution = "t"
 
     options = {}
-    if CI_distribution.startswith("z"):
+    if CI_distribution == "z":
         interval_func = stats.norm.interval
         ddof = 0
     else:
@@ -539,24 +545,14 @@ def _get_plotting_function(ax, plot_function_str, valid):
     This method is intended for internal use only.
 
     """
-    plotting_functions_dict = {
-        "plot": ax.plot,
-        "semilogx": ax.semilogx,
-        "semilogy": ax.semilogy,
-        "loglog": ax.loglog,
-    }
-
     # Ensure plotting function is valid
-    if (
-        plot_function_str not in plotting_functions_dict
-        or plot_function_str not in valid
-    ):
+    if plot_function_str not in PLOTTING_FUNCTIONS or plot_function_str not in valid:
         raise ValueError(
             "'{0}' not a valid plotting option. Must be one of the "
             "following options: '{1}'.".format(plot_function_str, valid)
         )
 
-    return plotting_functions_dict[plot_function_str]
+    return getattr(ax, plot_function_str)
 
 
 def _get_legend_args(ax, legend, observable, **kwargs):
@@ -631,52 +627,41 @@ def _get_line_property_cycler(n_current, n_new, kwarg_prefix=None, **kwargs):
     This method is intended for internal use only.
 
     """
-    # Get the prop_cycler
-    prop_cycler = kwargs.get("prop_cycler")
-    n_total = n_current + n_new
+    # Get the prop_cycle
+    prop_cycler = kwargs.get("prop_cycle")
     if prop_cycler is None:
         cycler_kwargs_values = {}
-        # Get current number of lines on the plot, excluding time points.
-        default_cycler_values = {
-            "color": _get_default_colors(n_total)[n_current:n_total],
-            "linestyle": [rc.defaultParams["lines.linestyle"][0]] * n_new,
-            "linewidth": [rc.defaultParams["lines.linewidth"][0]] * n_new,
-            "marker": [rc.defaultParams["lines.marker"][0]] * n_new,
-            "markersize": [rc.defaultParams["lines.markersize"][0]] * n_new,
-        }
-
-        for k in default_cycler_values:
+        for k in ["color", "linestyle", "linewidth", "marker", "markersize"]:
             values = ensure_iterable(kwargs.get(k))
             # Don't add to cycler instance if it was not provided.
             if not values:
                 continue
 
-            msg = ""
-
             # If only one value given, apply it to all lines.
             if len(values) == 1 and n_new != 1:
                 values = values * n_new
             # Raise warning if the number of given values does not match the
-            # number of new items. Do not need to include this message
-            # if invalid kwarg values were found.
-            if len(values) != n_new and not msg:
-                msg += "Wrong number of values for `{0}` provided".format(k)
-
-            if msg:
-                # Raise warning if a warning message was created and utilize
-                # default values for that kwarg.
-                warn(msg + ". Therefore utilizing default values instead.")
-                cycler_kwargs_values[k] = default_cycler_values[k]
-            else:
-                # Add to cycler initialization args.
-                cycler_kwargs_values[k] = values
+            # number of new items and utilize default values for that kwarg.
+            if len(values) != n_new:
+                warn(
+                    "Wrong number of values for `{0}` provided. Therefore "
+                    "utilizing default values instead.".format(k)
+                )
+                if k == "color":
+                    # Default colors are set below.
+                    continue
+                values = [rc.defaultParams["lines." + k][0]] * n_new
+
+            # Add to cycler initialization args.
+            cycler_kwargs_values[k] = values
 
         if "color" not in cycler_kwargs_values:
-            cycler_kwargs_values["color"] = default_cycler_values["color"]
+            # Get default colors after the current lines on the plot.
+            n_total = n_current + n_new
+            cycler_kwargs_values["color"] = _get_default_colors(n_total)[
+                n_current:n_total
+            ]
         prop_cycler = cycler(**cycler_kwargs_values)
-        # Validate cycler and ensure matplotlib format. Though the earlier
-        # validation functions should have caught all issues, this extra
-        # step catches potential edge cases that may have slipped through.
 
     return prop_cycler
 
@@ -689,7 +674,11 @@ def _set_axes_labels(ax, **kwargs):
     This method is intended for internal use only.
 
     """
-    for label_type in ["xlabel", "ylabel", "title"]:
+    for label_type, set_label in (
+        ("xlabel", ax.set_xlabel),
+        ("ylabel", ax.set_ylabel),
+        ("title", ax.set_title),
+    ):
         label_values = kwargs.get(label_type)
         if label_values is None:
             # No label provided
@@ -707,7 +696,7 @@ def _set_axes_labels(ax, **kwargs):
         # Try setting the label
         if label_str is not None:
             try:
-                getattr(ax, "set_" + label_type)(label_str, fontdict=fontdict)
+                set_label(label_str, fontdict=fontdict)
             except ValueError as e:
                 warn(
                     "Could not set `{0}` due to the following: '{1}'.".format(
@@ -724,7 +713,7 @@ def _set_axes_limits(ax, **kwargs):
     This method is intended for internal use only.
 
     """
-    for limit_type in ["xlim", "ylim"]:
+    for limit_type, set_limit in (("xlim", ax.set_xlim), ("ylim", ax.set_ylim)):
         limit_values = kwargs.get(limit_type)
         if limit_values is None:
             # No limits provided
@@ -732,17 +721,14 @@ def _set_axes_limits(ax, **kwargs):
         if not hasattr(limit_values, "__iter__") or len(limit_values) != 2:
             # Invalid limit input provided
             _raise_kwarg_warning(limit_type, msg="'{0}'".format(limit_values))
-            limit_values = None
-        # Try setting the label
-        if limit_values is not None:
-            try:
-                getattr(ax, "set_" + limit_type)(tuple(limit_values))
-            except ValueError as e:
-                warn(
-                    "Could not set `{0}` due to the following: '{1}'".format(
-                        limit_type, e
-                    )
-                )
+            continue
+        # Try setting the limits
+        try:
+            set_limit(tuple(limit_values))
+        except ValueError as e:
+            warn(
+                "Could not set `{0}` due to the following: '{1}'".format(limit_type, e)
+            )
 
 
 def _set_axes_gridlines(ax, **kwargs):
@@ -758,9 +744,12 @@ def _set_axes_gridlines(ax, **kwargs):
     if grid is not None:
         # Validate additional grid argument inputs
         grid_options = {}
-        for k in ["color", "linestyle", "linewidth"]:
-            prefix = "grid_"
-            v = kwargs.get(prefix + k)
+        for kwarg_name, k in (
+            ("grid_color", "color"),
+            ("grid_linestyle", "linestyle"),
+            ("grid_linewidth", "linewidth"),
+        ):
+            v = kwargs.get(kwarg_name)
             if v is not None:
                 grid_options[k] = v
 
@@ -791,8 +780,10 @@ def _set_axes_margins(ax, x_default=None, y_default=None, tile=False, **kwargs):
         prefix = "tile_"
     else:
         prefix = ""
-    for arg, margin_default in zip(["x", "y"], [x_default, y_default]):
-        margin_arg = arg + "margin"
+    for margin_arg, set_margin, margin_default in (
+        ("xmargin", ax.set_xmargin, x_default),
+        ("ymargin", ax.set_ymargin, y_default),
+    ):
         # Validate margin value
         margin_value = kwargs.get(prefix + margin_arg, None)
         # Use default value if None
@@ -802,7 +793,7 @@ def _set_axes_margins(ax, x_default=None, y_default=None, tile=False, **kwargs):
                 margin_default = rc.defaultParams["axes." + margin_arg][0]
             margin_value = margin_default
         # Set the margin value
-        getattr(ax, "set_" + margin_arg)(margin_value)
+        set_margin(margin_value)
 
 
 def _set_annotated_time_points(
@@ -857,36 +848,38 @@ def _set_annotated_time_points(
     lines = _get_ax_current(ax)
     if type_of_plot == "phase_portrait":
         lines = lines[len(lines) - 1 :]
+        # Group the solutions once for all time points
+        xy_sols = _group_xy_items(observable, itervalues)
     else:
         lines = lines[len(lines) - len(observable) :]
 
+    # Make the prop_cycler for the time points once. The colors are always
+    # set by the validation of the inputs.
+    time_points_cycler = cycler(
+        **{
+            "color": colors,
+            "linestyle": [" "] * len(time_points),
+            "marker": markers,
+            "markersize": marker_sizes,
+        }
+    )
     for line in lines:
-        # Set up the prop_cycler arguments for the time points
-        if colors is None:
-            colors = [line.get_color()] * len(time_points)
-        # Make and set the prop_cycler for the time points
-        ax.set_prop_cycle(
-            cycler(
-                **{
-                    "color": colors,
-                    "linestyle": [" "] * len(time_points),
-                    "marker": markers,
-                    "markersize": marker_sizes,
-                }
-            ),
-        )
+        # Set the prop_cycler so each line starts at the first time point
+        ax.set_prop_cycle(time_points_cycler)
+
+        if type_of_plot != "phase_portrait":
+            # Get the solution of the line once for all time points
+            sol = observable[line.get_label()]
 
         for i, t in enumerate(time_points):
             label = "t=" + str(t)
             # Check if phase portrait or time profile
             if type_of_plot == "phase_portrait":
                 # Handle as a phase portrait, get solutions and plot
-                items = _group_xy_items(observable, itervalues)
-                x, y = items[0][i], items[1][i]
+                x, y = xy_sols[0][i], xy_sols[1][i]
             else:
                 # Handle as a time profile, get solutions and plot
-                items = observable[line.get_label()]
-                x, y = t, items[i]
+                x, y = t, sol[i]
 
             plot_function(
                 x, y, label=label, zorder=kwargs.get("annotate_time_points_zorder")
@@ -1006,7 +999,10 @@ def _get_default_cycler():
 
 
 def _get_default_colors(n_items):
-    """Return a list of the colors for a given number of items.
+    """Return the colors for a given number of items.
+
+    Colors taken from a colormap are returned as an array of RGBA rows, while
+    colors from the default cycler are returned as a list.
 
     Warnings
     --------
@@ -1014,27 +1010,57 @@ def _get_default_colors(n_items):
 
     """
     default_color_cycler = _get_default_cycler()
-    points = np.linspace(0, 1, 20)
     # Get additional colors if n_items exceeds number of colors in the cycler
     if len(default_color_cycler) < n_items <= 20:
-        colors = mpl.cm.get_cmap("tab20")(points)
+        colors = _get_tab20_colors()[:20]
     elif len(default_color_cycler) < n_items <= 60:
-        colors = np.vstack(
-            (
-                mpl.cm.get_cmap("tab20")(points),
-                mpl.cm.get_cmap("tab20b")(points),
-                mpl.cm.get_cmap("tab20c")(points),
-            )
-        )
+        colors = _get_tab20_colors()
     elif len(default_color_cycler) < n_items:
         # A large number of items exists, cannot use distinct tab20 colors,
         # use a different colormap altogether
-        colors = mpl.cm.get_cmap("nipy_spectral")(np.linspace(0, 1, n_items))
+        colors = _get_colormap("nipy_spectral")(np.linspace(0, 1, n_items))
     else:
         # Utilize the default cycler instance if it contains enough colors
         colors = [c["color"] for c in default_color_cycler]
 
-    return list(colors)
+    return colors
+
+
+@lru_cache(maxsize=None)
+def _get_colormap(name):
+    """Return the :mod:`matplotlib` colormap for a name, looking it up once.
+
+    Warnings
+    --------
+    This method is intended for internal use only.
+
+    """
+    return mpl.cm.get_cmap(name)
+
+
+@lru_cache(maxsize=1)
+def _get_tab20_colors():
+    """Return the 60 colors of the tab20, tab20b, and tab20c colormaps.
+
+    The colors are sampled from the colormaps once and reused afterwards.
+
+    Warnings
+    --------
+    This method is intended for internal use only.
+
+    """
+    points = np.linspace(0, 1, 20)
+    colors = np.vstack(
+        (
+            _get_colormap("tab20")(points),
+            _get_colormap("tab20b")(points),
+            _get_colormap("tab20c")(points),
+        )
+    )
+    # Prevent changes to the shared colors
+    colors.setflags(write=False)
+
+    return colors
 
 
 def _get_ax_current(ax, time_points=False):
@@ -1045,22 +1071,19 @@ def _get_ax_current(ax, time_points=False):
     This method is intended for internal use only.
 
     """
+    # Get each label once, ignoring lines without labels
     lines_with_labels = [
-        label for label in ax.get_lines() if "_line" not in label.get_label()
+        (line, label)
+        for line, label in ((line, line.get_label()) for line in ax.get_lines())
+        if "_line" not in label
     ]
     if time_points:
-        return [
-            label for label in lines_with_labels if label.get_label().startswith("t=")
-        ]
+        return [line for line, label in lines_with_labels if label.startswith("t=")]
 
     lines_with_labels = [
-        label
-        for label in lines_with_labels
-        if not (
-            label.get_label().endswith("_lb")
-            or label.get_label().endswith("_ub")
-            or label.get_label().startswith("t=")
-        )
+        line
+        for line, label in lines_with_labels
+        if not (label.endswith(("_lb", "_ub")) or label.startswith("t="))
     ]
 
     return lines_with_labels
@@ -1187,12 +1210,9 @@ def _get_dataframe_of_observables(x, y, compare, observable):
             ]
         else:
             observable = [getattr(x, "id", x) for x in ensure_iterable(observable)]
-        if set(observable).difference(xy.index):
-            raise ValueError(
-                "Invalid `observable` values: '{0}'".format(
-                    set(observable).difference(xy.index)
-                )
-            )
+        invalid = set(observable).difference(xy.index)
+        if invalid:
+            raise ValueError("Invalid `observable` values: '{0}'".format(invalid))
         else:
             xy = xy.loc[observable]
 
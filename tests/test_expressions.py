@@ -0,0 +1,204 @@
+# -*- coding: utf-8 -*-
+"""Tests for the expressions generated and compiled for the models."""
+import gc
+import weakref
+
+import numpy as np
+import pytest
+import sympy as sym
+from scipy.integrate import solve_ivp
+
+from mass.example_data import create_example_model
+from mass.util.expressions import (
+    _clear_rate_expression_cache,
+    compile_odes,
+    compile_rates,
+    generate_disequilibrium_ratio,
+    generate_mass_action_rate_expression,
+    generate_mass_action_ratio,
+    generate_ode,
+    strip_time,
+)
+
+
+BACKENDS = ["numpy", "numba", "symengine"]
+
+
+@pytest.fixture(scope="module")
+def model():
+    return create_example_model("Glycolysis")
+
+
+def _check_cached(function, reaction, *args):
+    cached = function(reaction, *args)
+    _clear_rate_expression_cache(reaction)
+    assert cached == function(reaction, *args)
+
+
+@pytest.mark.parametrize("rate_type", [1, 2, 3])
+def test_generate_mass_action_rate_expression_cache(rate_type):
+    model = create_example_model("Glycolysis")
+    reaction = model.reactions.get_by_id("HEX1")
+    function = generate_mass_action_rate_expression
+    rate = function(reaction, rate_type)
+    assert function(reaction, rate_type) is rate
+
+    # Changes to the reaction or its metabolites regenerate the rate
+    reaction.add_metabolites({model.metabolites.get_by_id("h2o_c"): -1})
+    _check_cached(function, reaction, rate_type)
+    model.metabolites.get_by_id("atp_c").fixed = True
+    _check_cached(function, reaction, rate_type)
+    reaction.reversible = False
+    _check_cached(function, reaction, rate_type)
+    assert function(reaction, rate_type) != rate
+
+    boundary_reaction = model.reactions.get_by_id("SK_glc__D_c")
+    function(boundary_reaction, rate_type)
+    model.add_boundary_conditions({"glc__D_b": "sin(t)"})
+    _check_cached(function, boundary_reaction, rate_type)
+
+
+@pytest.mark.parametrize(
+    "function", [generate_mass_action_ratio, generate_disequilibrium_ratio]
+)
+def test_generate_ratio_cache(function):
+    model = create_example_model("Glycolysis")
+    reaction = model.reactions.get_by_id("HEX1")
+    ratio = function(reaction)
+    assert function(reaction) is ratio
+
+    # Changes to the reaction or its metabolites regenerate the ratio
+    reaction.add_metabolites({model.metabolites.get_by_id("nad_c"): -1})
+    _check_cached(function, reaction)
+    assert function(reaction) != ratio
+    model.metabolites.get_by_id("atp_c").fixed = True
+    _check_cached(function, reaction)
+
+
+def test_generate_mass_action_rate_expression_cache_releases_model():
+    model = create_example_model("Glycolysis")
+    model.rates
+    model_ref = weakref.ref(model)
+    del model
+    gc.collect()
+    assert model_ref() is None
+
+
+def test_generate_odes_cache_releases_model():
+    model = create_example_model("Glycolysis")
+    model.odes
+    model_ref = weakref.ref(model)
+    del model
+    gc.collect()
+    assert model_ref() is None
+
+
+def test_generate_odes_cache():
+    model = create_example_model("Glycolysis")
+    odes = model.odes
+    assert model.odes == odes
+    # The returned dict can be changed without altering the stored ODEs
+    odes.clear()
+    assert all(model.odes[met] == generate_ode(met) for met in model.metabolites)
+
+    # Changing the stoichiometry or fixing a metabolite updates the ODEs
+    reaction = model.reactions.get_by_id("HEX1")
+    metabolite = model.metabolites.get_by_id("h2o_c")
+    reaction.add_metabolites({metabolite: -1})
+    model.metabolites.get_by_id("atp_c").fixed = True
+    odes = model.odes
+    assert odes[metabolite] == generate_ode(metabolite)
+    assert odes[metabolite].has(reaction.rate)
+    assert odes[model.metabolites.get_by_id("atp_c")] == 0
+
+
+def _check_backend(backend):
+    if backend != "numpy":
+        pytest.importorskip(backend)
+
+
+def _make_values(ids, seed):
+    return np.random.default_rng(seed).uniform(0.1, 2.0, len(ids))
+
+
+def _evaluate(expr, variable_ids, variables, parameter_ids, parameters):
+    values = dict(zip(map(sym.Symbol, variable_ids), variables))
+    values.update(zip(map(sym.Symbol, parameter_ids), parameters))
+    return float(expr.subs(values))
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_compile_rates(model, backend):
+    _check_backend(backend)
+    function, metabolite_ids, parameter_ids = compile_rates(model, backend)
+    concentrations = _make_values(metabolite_ids, 0)
+    parameters = _make_values(parameter_ids, 1)
+
+    expected = [
+        _evaluate(rate, metabolite_ids, concentrations, parameter_ids, parameters)
+        for rate in strip_time(model.rates).values()
+    ]
+    assert np.allclose(function(concentrations, parameters), expected, rtol=1e-10)
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_compile_odes(model, backend):
+    _check_backend(backend)
+    function, metabolite_ids, parameter_ids = compile_odes(model, backend)
+    concentrations = _make_values(metabolite_ids, 0)
+    parameters = _make_values(parameter_ids, 1)
+
+    odes = {met.id: ode for met, ode in strip_time(model.odes).items()}
+    expected = [
+        _evaluate(odes[mid], metabolite_ids, concentrations, parameter_ids, parameters)
+        for mid in metabolite_ids
+    ]
+    assert np.allclose(function(0.0, concentrations, parameters), expected, rtol=1e-10)
+
+
+def _integrate(model, backend, t_final, perturbations=None):
+    function, metabolite_ids, parameter_ids = compile_odes(model, backend)
+    values = model._get_all_parameters()
+    values.update({met.id: ic for met, ic in model.initial_conditions.items()})
+    for mid, factor in (perturbations or {}).items():
+        values[mid] *= factor
+
+    y0 = np.array([values[mid] for mid in metabolite_ids])
+    parameters = np.array([values[pid] for pid in parameter_ids])
+    solution = solve_ivp(
+        function,
+        (0, t_final),
+        y0,
+        method="LSODA",
+        args=(parameters,),
+        rtol=1e-8,
+        atol=1e-10,
+    )
+    assert solution.success
+    return y0, solution.y[:, -1]
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_compile_odes_solve_ivp(model, backend):
+    _check_backend(backend)
+    # The initial conditions of the model are at steady state
+    y0, y_final = _integrate(model, backend, 1000)
+    assert np.allclose(y_final, y0, rtol=1e-8)
+
+    # Perturbed solutions must agree with those of the numpy backend
+    perturbations = {"atp_c": 1.5}
+    y_final = _integrate(model, backend, 100, perturbations)[1]
+    expected = _integrate(model, "numpy", 100, perturbations)[1]
+    assert np.allclose(y_final, expected, rtol=1e-8)
+
+
+@pytest.mark.parametrize("compile_function", [compile_rates, compile_odes])
+def test_compile_symengine_matches_numpy(model, compile_function):
+    pytest.importorskip("symengine")
+    function, metabolite_ids, parameter_ids = compile_function(model, "symengine")
+    expected_function = compile_function(model, "numpy")[0]
+    args = (_make_values(metabolite_ids, 0), _make_values(parameter_ids, 1))
+    if compile_function is compile_odes:
+        args = (0.0,) + args
+
+    assert np.allclose(function(*args), expected_function(*args), rtol=1e-10)
@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+"""Tests for the cached values and context handling of the MassModel."""
+import gc
+import weakref
+
+import numpy as np
+import pytest
+
+import mass.core.mass_model
+from mass.example_data import create_example_model
+from mass.util.matrix import matrix_rank
+
+
+@pytest.fixture
+def model():
+    return create_example_model("Glycolysis")
+
+
+def _is_freed(model_ref):
+    gc.collect()
+    return model_ref() is None
+
+
+@pytest.mark.parametrize(
+    "access", [lambda m: m.S, lambda m: m._repr_html_(), lambda m: m.copy()]
+)
+def test_stoichiometric_matrix_cache_releases_model(access):
+    model = create_example_model("Glycolysis")
+    access(model)
+    model_ref = weakref.ref(model)
+    del model
+    assert _is_freed(model_ref)
+
+
+def _count_calls(monkeypatch, obj, name):
+    calls = []
+    method = getattr(obj, name)
+
+    def wrapper(*args, **kwargs):
+        calls.append(args)
+        return method(*args, **kwargs)
+
+    monkeypatch.setattr(obj, name, wrapper)
+    return calls
+
+
+def test_stoichiometric_matrix_cache(model, monkeypatch):
+    calls = _count_calls(monkeypatch, model, "_mk_stoich_matrix")
+    S = model.S
+    assert len(calls) == 1
+    # The cached matrix is reused, but cannot be altered through a copy
+    S[0, 0] = 100
+    assert model.S[0, 0] != 100
+    assert len(calls) == 1
+
+    # Changing the stoichiometry rebuilds the matrix
+    reaction = model.reactions.get_by_id("HEX1")
+    metabolite = model.metabolites.get_by_id("h2o_c")
+    reaction.add_metabolites({metabolite: -1})
+    S = model.S
+    assert len(calls) == 2
+    assert S[model.metabolites.index(metabolite), model.reactions.index(reaction)] == -1
+
+
+def test_stoichiometric_matrix_rank_cache(model, monkeypatch):
+    calls = _count_calls(monkeypatch, mass.core.mass_model, "matrix_rank")
+    model._repr_html_()
+    model._repr_html_()
+    assert len(calls) == 1
+
+    # Changing the stoichiometry recomputes the rank
+    reaction = model.reactions.get_by_id("HEX1")
+    reaction.add_metabolites({model.metabolites.get_by_id("h2o_c"): -1})
+    html = model._repr_html_()
+    assert len(calls) == 2
+    assert "<td>{0}</td>".format(matrix_rank(model.S)) in html
+
+
+def test_update_initial_conditions_context(model):
+    atp_c = model.metabolites.get_by_id("atp_c")
+    adp_c = model.metabolites.get_by_id("adp_c")
+    expected = {atp_c: atp_c.initial_condition, adp_c: adp_c.initial_condition}
+    with model:
+        # The same metabolite may be given by both its identifier and object
+        model.update_initial_conditions({"atp_c": 5.0, atp_c: 7.0, "adp_c": 2.0})
+        assert atp_c.initial_condition == 7.0
+        assert adp_c.initial_condition == 2.0
+    assert {met: met.initial_condition for met in expected} == expected
+
+
+def test_add_boundary_conditions_context(model):
+    model.remove_boundary_conditions(["pyr_b"])
+    expected = model.boundary_conditions.copy()
+    with model:
+        model.add_boundary_conditions({"glc__D_b": 2.0, "pyr_b": 3.0})
+        assert model.boundary_conditions["glc__D_b"] == 2.0
+        assert model.boundary_conditions["pyr_b"] == 3.0
+    assert model.boundary_conditions == expected
+
+
+def test_custom_rates_context(model):
+    reaction = model.reactions.get_by_id("HEX1")
+    with model:
+        model.add_custom_rate(reaction, "kf_HEX1 * k_new", {"k_new": 2.0})
+        model.add_custom_rate(reaction, "kf_HEX1 * k_other", {"k_other": 3.0})
+        assert set(model.custom_parameters) == {"k_new", "k_other"}
+        with model:
+            model.reset_custom_rates()
+            assert not model.custom_rates
+        assert str(model.custom_rates[reaction]) == "k_other*kf_HEX1"
+        assert model.custom_parameters == {"k_new": 2.0, "k_other": 3.0}
+    assert not model.custom_rates
+    assert not model.custom_parameters
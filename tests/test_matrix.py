@@ -0,0 +1,28 @@
+# -*- coding: utf-8 -*-
+"""Tests for the linear algebra functions of the matrix module."""
+import numpy as np
+import pytest
+
+from mass.example_data import create_example_model
+from mass.util.matrix import (
+    columnspace,
+    left_nullspace,
+    matrix_rank,
+    nullspace,
+    rowspace,
+)
+
+
+@pytest.fixture(scope="module")
+def model():
+    return create_example_model("Glycolysis")
+
+
+@pytest.mark.parametrize("array_type", ["dok", "lil", "csr", "DataFrame"])
+@pytest.mark.parametrize(
+    "function", [nullspace, left_nullspace, columnspace, rowspace, matrix_rank]
+)
+def test_linear_algebra_array_types(model, array_type, function):
+    S = model.update_S(array_type=array_type, update_model=False)
+    expected = function(model.update_S(array_type="dense", update_model=False))
+    assert np.allclose(function(S), expected)